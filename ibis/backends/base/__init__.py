@@ -4,9 +4,12 @@ import abc
 import collections.abc
 import functools
 import importlib.metadata
+import itertools
 import keyword
+import operator
+import queue
 import re
-import sys
+import threading
 import urllib.parse
 from pathlib import Path
 from typing import (
@@ -14,6 +17,7 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Hashable,
     Iterable,
     Iterator,
     Mapping,
@@ -34,6 +38,10 @@ if TYPE_CHECKING:
 
 __all__ = ('BaseBackend', 'Database', 'connect')
 
+_compile_like = functools.lru_cache(maxsize=128)(re.compile)
+_KEYWORDS = frozenset(keyword.kwlist)
+_REGEX_METACHAR_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
 
 class Database:
     """Generic Database class."""
@@ -112,6 +120,10 @@ class Database:
         Table
             Table expression
         """
+        if table.startswith("_"):
+            # avoid a round trip to the backend for the many dunder and
+            # private attribute probes done by python and IPython
+            raise AttributeError(table)
         return self.table(table)
 
     def _qualify(self, value):
@@ -160,7 +172,7 @@ class Database:
         return self.client.list_tables(like, database=database or self.name)
 
 
-class TablesAccessor(collections.abc.Mapping):
+class TablesAccessor:
     """A mapping-like object for accessing tables off a backend.
 
     Tables may be accessed by name using either index or attribute access:
@@ -172,8 +184,25 @@ class TablesAccessor(collections.abc.Mapping):
     >>> people = con.tables.people  # access via attribute
     """
 
+    __slots__ = ("_backend", "_cached_names", "_cached_dir")
+
     def __init__(self, backend: BaseBackend):
         self._backend = backend
+        self._cached_names = None
+        self._cached_dir = None
+
+    def _list_tables(self) -> tuple[str, ...]:
+        """Return the backend's table names.
+
+        The backend is queried on every call so that each use of the accessor
+        sees tables created or dropped since the previous one. The `__dir__`
+        listing derived from the names is only rebuilt when they change.
+        """
+        names = tuple(self._backend.list_tables())
+        if names != self._cached_names:
+            self._cached_names = names
+            self._cached_dir = None
+        return names
 
     def __getitem__(self, name) -> ir.Table:
         try:
@@ -190,29 +219,107 @@ class TablesAccessor(collections.abc.Mapping):
             raise AttributeError(name) from exc
 
     def __iter__(self) -> Iterator[str]:
-        return iter(sorted(self._backend.list_tables()))
+        return iter(self._list_tables())
 
     def __len__(self) -> int:
-        return len(self._backend.list_tables())
+        return len(self._list_tables())
 
     def __dir__(self) -> list[str]:
-        o = set()
-        o.update(dir(type(self)))
-        o.update(
-            name
-            for name in self._backend.list_tables()
-            if name.isidentifier() and not keyword.iskeyword(name)
-        )
+        names = self._list_tables()
+        if (o := self._cached_dir) is None:
+            o = self._cached_dir = _TABLES_ACCESSOR_ATTRS.union(
+                name for name in names if name.isidentifier() and name not in _KEYWORDS
+            )
         return list(o)
 
     def __repr__(self) -> str:
-        tables = self._backend.list_tables()
+        tables = self._list_tables()
         rows = ["Tables", "------"]
         rows.extend(f"- {name}" for name in sorted(tables))
         return "\n".join(rows)
 
     def _ipython_key_completions_(self) -> list[str]:
-        return self._backend.list_tables()
+        return list(self._list_tables())
+
+    def __contains__(self, name) -> bool:
+        try:
+            self[name]
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def keys(self) -> collections.abc.KeysView:
+        return collections.abc.KeysView(self)
+
+    def items(self) -> collections.abc.ItemsView:
+        return collections.abc.ItemsView(self)
+
+    def values(self) -> collections.abc.ValuesView:
+        return collections.abc.ValuesView(self)
+
+
+collections.abc.Mapping.register(TablesAccessor)
+
+_TABLES_ACCESSOR_ATTRS = frozenset(dir(TablesAccessor))
+
+
+def _hashable_identity_part(value: Any) -> Hashable:
+    """Return `value` if it's hashable, otherwise its string form."""
+    try:
+        hash(value)
+    except TypeError:
+        return str(value)
+    return value
+
+
+def _write_batches_in_background(
+    batches: Iterable[pa.RecordBatch],
+    write_batch: Callable[[pa.RecordBatch], None],
+    *,
+    maxsize: int = 4,
+) -> None:
+    """Write `batches` from a background thread while they're being fetched.
+
+    Batches are pulled from `batches` on the calling thread, since many
+    database drivers don't allow their cursors to be used from other threads,
+    and handed to `write_batch` on a writer thread through a bounded queue.
+    Fetching the next batch and encoding the previous one can then overlap,
+    as both pyarrow's writers and most drivers release the GIL.
+    """
+    batch_queue = queue.Queue(maxsize=maxsize)
+    done = object()
+    errors = []
+
+    def consume():
+        try:
+            while (batch := batch_queue.get()) is not done:
+                write_batch(batch)
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+            # keep draining so the producer never blocks on a full queue
+            while batch_queue.get() is not done:
+                pass
+
+    writer = threading.Thread(target=consume, name="ibis-batch-writer", daemon=True)
+    writer.start()
+    try:
+        for batch in batches:
+            if errors:
+                break
+            batch_queue.put(batch)
+    finally:
+        batch_queue.put(done)
+        writer.join()
+
+    if errors:
+        raise errors[0]
 
 
 class _FileIOHandler:
@@ -227,6 +334,16 @@ class _FileIOHandler:
         else:
             return pyarrow
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _import_pyarrow_submodule(name: str):
+        """Import `pyarrow.<name>` once and reuse it on subsequent calls.
+
+        Call `_import_pyarrow` first to get a helpful error message when
+        pyarrow isn't installed.
+        """
+        return importlib.import_module(f"pyarrow.{name}")
+
     @util.experimental
     def to_pyarrow(
         self,
@@ -259,34 +376,33 @@ class _FileIOHandler:
             A pyarrow table holding the results of the executed expression.
         """
         pa = self._import_pyarrow()
-        try:
-            # Can't construct an array from record batches
-            # so construct at one column table (if applicable)
-            # then return the column _from_ the table
-            table = pa.Table.from_batches(
-                self.to_pyarrow_batches(expr, params=params, limit=limit, **kwargs)
-            )
-        except pa.lib.ArrowInvalid:
-            raise
-        except ValueError:
+        reader = self.to_pyarrow_batches(expr, params=params, limit=limit, **kwargs)
+
+        if isinstance(expr, ir.Scalar):
+            # only the first value is needed, so skip building a table
+            for batch in reader:
+                if batch.num_rows:
+                    return batch.column(0)[0]
+            raise IndexError("scalar expression produced no rows")
+        elif isinstance(expr, ir.Column):
+            # gather the column's chunks without wrapping them in a table,
+            # and only copy when there's more than one chunk to flatten
+            arrays = [batch.column(0) for batch in reader]
+            if not arrays:
+                return pa.array([], type=reader.schema.field(0).type)
+            elif len(arrays) == 1:
+                return arrays[0]
+            return pa.concat_arrays(arrays)
+        elif not isinstance(expr, ir.Table):
+            raise ValueError
+
+        batches = iter(reader)
+        if (first := next(batches, None)) is None:
             # The pyarrow batches iterator is empty so pass in an empty
             # iterator and a pyarrow schema
             schema = expr.as_table().schema()
-            table = pa.Table.from_batches([], schema=schema.to_pyarrow())
-
-        if isinstance(expr, ir.Table):
-            return table
-        elif isinstance(expr, ir.Column):
-            # Column will be a ChunkedArray, `combine_chunks` will
-            # flatten it
-            if len(table.columns[0]):
-                return table.columns[0].combine_chunks()
-            else:
-                return pa.array(table.columns[0])
-        elif isinstance(expr, ir.Scalar):
-            return table.columns[0][0]
-        else:
-            raise ValueError
+            return pa.Table.from_batches([], schema=schema.to_pyarrow())
+        return pa.Table.from_batches(itertools.chain((first,), batches))
 
     @util.experimental
     def to_pyarrow_batches(
@@ -324,6 +440,49 @@ class _FileIOHandler:
         """
         raise NotImplementedError
 
+    @util.experimental
+    def to_arrow_reader(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> pa.ipc.RecordBatchReader:
+        """Execute expression and return a RecordBatchReader for streaming.
+
+        The reader can be handed directly to consumers that accept a
+        `pyarrow.RecordBatchReader` (DuckDB, Polars, Delta Lake, ...), which
+        avoids materializing the results in between. This is an alias of
+        [`to_pyarrow_batches`][ibis.backends.base.BaseBackend.to_pyarrow_batches].
+
+        The reader may hold on to backend resources such as an open cursor
+        until it's exhausted, so the backend connection must outlive it.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        results
+            RecordBatchReader
+        """
+        return self.to_pyarrow_batches(
+            expr, params=params, limit=limit, chunk_size=chunk_size, **kwargs
+        )
+
     def read_parquet(
         self, path: str | Path, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -400,13 +559,15 @@ class _FileIOHandler:
         https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetWriter.html
         """
         self._import_pyarrow()
-        import pyarrow.parquet as pq
+        pq = self._import_pyarrow_submodule("parquet")
 
         batch_reader = expr.to_pyarrow_batches(params=params)
 
+        # pyarrow's single-file writers have no way to consume a reader
+        # directly, so stream batches through instead of materializing the
+        # full result as a table
         with pq.ParquetWriter(path, batch_reader.schema) as writer:
-            for batch in batch_reader:
-                writer.write_batch(batch)
+            _write_batches_in_background(batch_reader, writer.write_batch)
 
     @util.experimental
     def to_csv(
@@ -436,13 +597,12 @@ class _FileIOHandler:
         https://arrow.apache.org/docs/python/generated/pyarrow.csv.CSVWriter.html
         """
         self._import_pyarrow()
-        import pyarrow.csv as pcsv
+        pcsv = self._import_pyarrow_submodule("csv")
 
         batch_reader = expr.to_pyarrow_batches(params=params)
 
         with pcsv.CSVWriter(path, batch_reader.schema) as writer:
-            for batch in batch_reader:
-                writer.write_batch(batch)
+            _write_batches_in_background(batch_reader, writer.write_batch)
 
 
 class BaseBackend(abc.ABC, _FileIOHandler):
@@ -462,10 +622,10 @@ class BaseBackend(abc.ABC, _FileIOHandler):
         # expression cache
         self._query_cache = RefCountedCache(
             populate=self._load_into_cache,
-            lookup=lambda name: self.table(name).op(),
+            lookup=self._cache_lookup,
             finalize=self._clean_up_cached_table,
             generate_name=functools.partial(util.gen_name, "cache"),
-            key=lambda expr: expr.op(),
+            key=operator.methodcaller("op"),
         )
 
     def __getstate__(self):
@@ -486,7 +646,7 @@ class BaseBackend(abc.ABC, _FileIOHandler):
         return self.db_identity == other.db_identity
 
     @functools.cached_property
-    def db_identity(self) -> str:
+    def db_identity(self) -> tuple:
         """Return the identity of the database.
 
         Multiple connections to the same
@@ -497,13 +657,17 @@ class BaseBackend(abc.ABC, _FileIOHandler):
 
         Returns
         -------
-        Hashable
+        tuple
             Database identity
         """
-        parts = [self.table_class.__name__]
-        parts.extend(self._con_args)
-        parts.extend(f'{k}={v}' for k, v in self._con_kwargs.items())
-        return '_'.join(map(str, parts))
+        return (
+            self.table_class.__name__,
+            tuple(map(_hashable_identity_part, self._con_args)),
+            tuple(
+                (k, _hashable_identity_part(v))
+                for k, v in sorted(self._con_kwargs.items(), key=lambda kv: kv[0])
+            ),
+        )
 
     def connect(self, *args, **kwargs) -> BaseBackend:
         """Connect to the database.
@@ -623,9 +787,12 @@ class BaseBackend(abc.ABC, _FileIOHandler):
         """
         if like is None:
             return list(values)
+        elif _REGEX_METACHAR_RE.search(like) is None:
+            # plain substring patterns don't need the regex engine
+            return sorted(t for t in values if like in t)
 
-        pattern = re.compile(like)
-        return sorted(filter(lambda t: pattern.findall(t), values))
+        search = _compile_like(like).search
+        return sorted(t for t in values if search(t) is not None)
 
     @abc.abstractmethod
     def list_tables(
@@ -936,6 +1103,9 @@ class BaseBackend(abc.ABC, _FileIOHandler):
         """
         del self._query_cache[expr.op()]
 
+    def _cache_lookup(self, name: str) -> ops.Node:
+        return self.table(name).op()
+
     def _load_into_cache(self, name, expr):
         raise NotImplementedError(self.name)
 
@@ -943,6 +1113,46 @@ class BaseBackend(abc.ABC, _FileIOHandler):
         raise NotImplementedError(self.name)
 
 
+# Backends shipped with ibis, mirroring the `ibis.backends` entry points
+# declared in pyproject.toml
+_BUILTIN_BACKENDS = frozenset(
+    {
+        "bigquery",
+        "clickhouse",
+        "dask",
+        "datafusion",
+        "druid",
+        "duckdb",
+        "impala",
+        "mssql",
+        "mysql",
+        "pandas",
+        "polars",
+        "postgres",
+        "pyspark",
+        "snowflake",
+        "sqlite",
+        "trino",
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_plugin_backend_names() -> frozenset[str]:
+    """Return the names of backends registered by third-party packages.
+
+    Scanning entry points touches the metadata of every installed
+    distribution, so callers that only need to recognize a name should use
+    `_is_backend_name`, which skips the scan for builtin backends.
+    """
+    return frozenset(ep.name for ep in util.backend_entry_points()) - _BUILTIN_BACKENDS
+
+
+def _is_backend_name(name: str) -> bool:
+    """Return whether `name` is the name of an installed backend."""
+    return name in _BUILTIN_BACKENDS or name in _get_plugin_backend_names()
+
+
 @functools.lru_cache(maxsize=None)
 def _get_backend_names() -> frozenset[str]:
     """Return the set of known backend names.
@@ -954,12 +1164,29 @@ def _get_backend_names() -> frozenset[str]:
     If a `set` is used, then any in-place modifications to the set
     are visible to every caller of this function.
     """
+    return _BUILTIN_BACKENDS | _get_plugin_backend_names()
+
+
+_WINDOWS_DRIVE_RE = re.compile("[A-Za-z]:")
+
+# file extension -> name of the backend that opens the file directly
+_FILE_BACKENDS = {".duckdb": "duckdb", ".sqlite": "sqlite", ".db": "sqlite"}
+
+# file extensions that are registered as a table in an in-memory duckdb
+# database
+_DUCKDB_REGISTER_EXTENSIONS = frozenset({".parquet", ".csv", ".csv.gz"})
 
-    if sys.version_info < (3, 10):
-        entrypoints = importlib.metadata.entry_points()["ibis.backends"]
-    else:
-        entrypoints = importlib.metadata.entry_points(group="ibis.backends")
-    return frozenset(ep.name for ep in entrypoints)
+
+def _file_extension(path: str) -> str:
+    """Return the extension of `path`, including compression suffixes."""
+    head, dot, ext = path.rpartition(".")
+    if not dot:
+        return ""
+    elif ext == "gz":
+        _, dot, inner = head.rpartition(".")
+        if dot:
+            return f".{inner}.gz"
+    return f".{ext}"
 
 
 def connect(resource: Path | str, **kwargs: Any) -> BaseBackend:
@@ -986,26 +1213,27 @@ def connect(resource: Path | str, **kwargs: Any) -> BaseBackend:
     """
     url = resource = str(resource)
 
-    if re.match("[A-Za-z]:", url):
+    if _WINDOWS_DRIVE_RE.match(url):
         # windows path with drive, treat it as a file
         url = f"file://{url}"
 
     parsed = urllib.parse.urlparse(url)
     scheme = parsed.scheme or "file"
 
-    orig_kwargs = kwargs.copy()
-    kwargs = dict(urllib.parse.parse_qsl(parsed.query))
+    if query := parsed.query:
+        query_kwargs = dict(urllib.parse.parse_qsl(query))
+    else:
+        query_kwargs = {}
 
     if scheme == "file":
         path = parsed.netloc + parsed.path
         # Merge explicit kwargs with query string, explicit kwargs
         # taking precedence
-        kwargs.update(orig_kwargs)
-        if path.endswith(".duckdb"):
-            return ibis.duckdb.connect(path, **kwargs)
-        elif path.endswith((".sqlite", ".db")):
-            return ibis.sqlite.connect(path, **kwargs)
-        elif path.endswith((".parquet", ".csv", ".csv.gz")):
+        kwargs = {**query_kwargs, **kwargs}
+        ext = _file_extension(path)
+        if (backend_name := _FILE_BACKENDS.get(ext)) is not None:
+            return getattr(ibis, backend_name).connect(path, **kwargs)
+        elif ext in _DUCKDB_REGISTER_EXTENSIONS:
             # Load parquet/csv/csv.gz files with duckdb by default
             con = ibis.duckdb.connect(**kwargs)
             con.register(path)
@@ -1013,33 +1241,39 @@ def connect(resource: Path | str, **kwargs: Any) -> BaseBackend:
         else:
             raise ValueError(f"Don't know how to connect to {resource!r}")
 
-    if kwargs:
-        # If there are kwargs (either explicit or from the query string),
-        # re-add them to the parsed URL
-        query = urllib.parse.urlencode(kwargs)
-        parsed = parsed._replace(query=query)
+    if query_kwargs:
+        # If there are kwargs from the query string, re-add them to the URL
+        query = urllib.parse.urlencode(query_kwargs)
 
     if scheme in ("postgres", "postgresql"):
         # Treat `postgres://` and `postgresql://` the same, just as postgres
         # does. We normalize to `postgresql` since that's what SQLAlchemy
         # accepts.
         scheme = "postgres"
-        parsed = parsed._replace(scheme="postgresql")
-
-    # Convert all arguments back to a single URL string
-    url = parsed.geturl()
-    if "://" not in url:
-        # SQLAlchemy requires a `://`, while urllib may roundtrip
-        # `duckdb://` to `duckdb:`. Here we re-add the missing `//`.
-        url = url.replace(":", "://", 1)
+        url_scheme = "postgresql"
+    else:
+        url_scheme = scheme
+
+    # Convert all arguments back to a single URL string. Only the scheme and
+    # query can change, so the remaining components are joined as-is rather
+    # than roundtripping through `urlunparse`, which may also drop the `//`
+    # SQLAlchemy requires (`duckdb://` -> `duckdb:`).
     if scheme in ("duckdb", "sqlite", "pyspark"):
         # SQLAlchemy wants an extra slash for URLs where the path
         # maps to a relative/absolute location on the filesystem
-        url = url.replace(":", ":/", 1)
+        url = f"{url_scheme}:///{parsed.netloc}{parsed.path}"
+    else:
+        url = f"{url_scheme}://{parsed.netloc}{parsed.path}"
+    if params := parsed.params:
+        url = f"{url};{params}"
+    if query:
+        url = f"{url}?{query}"
+    if fragment := parsed.fragment:
+        url = f"{url}#{fragment}"
 
     try:
         backend = getattr(ibis, scheme)
     except AttributeError:
         raise ValueError(f"Don't know how to connect to {resource!r}") from None
 
-    return backend._from_url(url, **orig_kwargs)
+    return backend._from_url(url, **kwargs)
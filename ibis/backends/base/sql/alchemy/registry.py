@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import contextlib
 import functools
 import operator
 from typing import Any
@@ -59,7 +58,7 @@ def _varargs_call(sa_func, t, args):
     trans_args = []
     for raw_arg in args:
         arg = t.translate(raw_arg)
-        with contextlib.suppress(AttributeError):
+        if isinstance(arg, sa.sql.expression.SelectBase):
             arg = arg.scalar_subquery()
         trans_args.append(arg)
     return sa_func(*trans_args)
@@ -269,7 +268,10 @@ def _searched_case(t, op):
 
 def _translate_case(t, op, *, value):
     return sa.case(
-        *zip(map(t.translate, op.cases), map(t.translate, op.results)),
+        *[
+            (t.translate(case), t.translate(result))
+            for case, result in zip(op.cases, op.results)
+        ],
         value=value,
         else_=t.translate(op.default),
     )
@@ -406,7 +408,7 @@ def _sort_key(t, op):
 
 
 def _string_join(t, op):
-    return sa.func.concat_ws(t.translate(op.sep), *map(t.translate, op.arg))
+    return sa.func.concat_ws(t.translate(op.sep), *[t.translate(arg) for arg in op.arg])
 
 
 def reduction(sa_func):
@@ -595,7 +597,7 @@ sqlalchemy_operation_registry: dict[Any, Any] = {
     ops.DateFromYMD: fixed_arity(sa.func.date, 3),
     ops.TimeFromHMS: fixed_arity(sa.func.time, 3),
     ops.TimestampFromYMDHMS: lambda t, op: sa.func.make_timestamp(
-        *map(t.translate, op.args)
+        *[t.translate(arg) for arg in op.args]
     ),
     ops.Degrees: unary(sa.func.degrees),
     ops.Radians: unary(sa.func.radians),
@@ -69,6 +69,12 @@ class AlchemyExprTranslator(ExprTranslator):
 
     supports_unnest_in_select = True
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # SQLAlchemy types of the ibis types seen so far; ibis types are
+        # hashable and immutable so they can key the cache directly
+        self._sqla_types = {}
+
     @functools.cached_property
     def dialect(self) -> sa.engine.interfaces.Dialect:
         if (name := self._dialect_name) == "default":
@@ -88,7 +94,11 @@ class AlchemyExprTranslator(ExprTranslator):
         )
 
     def get_sqla_type(self, data_type):
-        return to_sqla_type(self.dialect, data_type)
+        if (sqla_type := self._sqla_types.get(data_type)) is None:
+            sqla_type = self._sqla_types[data_type] = to_sqla_type(
+                self.dialect, data_type
+            )
+        return sqla_type
 
     def _maybe_cast_bool(self, op, arg):
         if (
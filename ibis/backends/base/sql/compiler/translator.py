@@ -188,6 +188,10 @@ class ExprTranslator:
         # For now, governing whether the result will have a name
         self.named = named
 
+        # Translations of the nodes seen so far, so that subtrees repeated
+        # within the expression are only translated once
+        self._memo = {}
+
     def _needs_name(self, op):
         if not self.named:
             return False
@@ -224,8 +228,14 @@ class ExprTranslator:
     def translate(self, op):
         assert isinstance(op, ops.Node), type(op)
 
-        if type(op) in self._rewrites:  # even if type(op) is in self._registry
-            op = self._rewrites[type(op)](op)
+        if (result := self._memo.get(op)) is None:
+            result = self._memo[op] = self._translate(op)
+        return result
+
+    def _translate(self, op):
+        # even if type(op) is in self._registry
+        if (rewrite := self._rewrites.get(type(op))) is not None:
+            op = rewrite(op)
 
         # TODO: use op MRO for subclasses instead of this isinstance spaghetti
         if isinstance(op, ops.ScalarParameter):
@@ -233,8 +243,7 @@ class ExprTranslator:
         elif isinstance(op, ops.TableNode):
             # HACK/TODO: revisit for more complex cases
             return '*'
-        elif type(op) in self._registry:
-            formatter = self._registry[type(op)]
+        elif (formatter := self._registry.get(type(op))) is not None:
             return formatter(self, op)
         else:
             raise com.OperationNotDefinedError(f'No translation rule for {type(op)}')
@@ -8,6 +8,7 @@ from ibis.backends.base.sql.compiler import DDL, DML
 from ibis.backends.base.sql.registry import quote_identifier, type_to_sql_string
 
 fully_qualified_re = re.compile(r"(.*)\.(?:`(.*)`|(.*))")
+_quoted_re = re.compile(r"(?:`(.*)`|(.*))")
 _format_aliases = {'TEXT': 'TEXTFILE'}
 
 
@@ -27,8 +28,7 @@ def is_fully_qualified(x):
 
 
 def _is_quoted(x):
-    regex = re.compile(r"(?:`(.*)`|(.*))")
-    quoted, _ = regex.match(x).groups()
+    quoted, _ = _quoted_re.match(x).groups()
     return quoted is not None
 
 
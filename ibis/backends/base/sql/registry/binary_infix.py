@@ -74,8 +74,6 @@ def contains(op_string: Literal["IN", "NOT IN"]) -> str:
             ):
                 array = op.options.to_expr().as_table().to_array().op()
                 right = table_array_view(translator, array)
-            else:
-                right = translator.translate(op.options)
         else:
             right = translator.translate(op.options)
 
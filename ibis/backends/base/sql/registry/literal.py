@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 import math
 
+import ibis.expr.datatypes as dt
 import ibis.expr.types as ir
 
 
@@ -21,23 +22,21 @@ def _boolean_literal_format(translator, op):
 
 
 def _string_literal_format(translator, op):
-    return "'{}'".format(op.value.replace("'", "\\'"))
+    return "'" + op.value.replace("'", "\\'") + "'"
 
 
 def _number_literal_format(translator, op):
-    if math.isfinite(op.value):
-        formatted = repr(op.value)
-    else:
-        if math.isnan(op.value):
-            formatted_val = 'NaN'
-        elif math.isinf(op.value):
-            if op.value > 0:
-                formatted_val = 'Infinity'
-            else:
-                formatted_val = '-Infinity'
-        formatted = f"CAST({formatted_val!r} AS DOUBLE)"
+    value = op.value
+    if math.isfinite(value):
+        return repr(value)
 
-    return formatted
+    if value != value:
+        formatted_val = 'NaN'
+    elif value > 0:
+        formatted_val = 'Infinity'
+    else:
+        formatted_val = '-Infinity'
+    return f"CAST({formatted_val!r} AS DOUBLE)"
 
 
 def _interval_literal_format(translator, op):
@@ -46,8 +45,10 @@ def _interval_literal_format(translator, op):
 
 def _date_literal_format(translator, op):
     value = op.value
-    if isinstance(value, datetime.date):
-        value = value.strftime('%Y-%m-%d')
+    if isinstance(value, datetime.datetime):
+        value = value.date().isoformat()
+    elif isinstance(value, datetime.date):
+        value = value.isoformat()
 
     return repr(value)
 
@@ -71,32 +72,49 @@ literal_formatters = {
 }
 
 
+_TYPECLASSES = (
+    (dt.Boolean, 'boolean'),
+    (dt.String, 'string'),
+    (dt.Date, 'date'),
+    (dt.Numeric, 'number'),
+    (dt.Timestamp, 'timestamp'),
+    (dt.Interval, 'interval'),
+    (dt.Set, 'set'),
+)
+
+# Literal formatter per concrete dtype class, filled in on first use
+_FORMATTER_BY_TYPE = {}
+
+
+def _literal_formatter(dtype_class):
+    try:
+        return _FORMATTER_BY_TYPE[dtype_class]
+    except KeyError:
+        pass
+
+    for base, typeclass in _TYPECLASSES:
+        if issubclass(dtype_class, base):
+            formatter = literal_formatters[typeclass]
+            break
+    else:
+        formatter = None
+
+    _FORMATTER_BY_TYPE[dtype_class] = formatter
+    return formatter
+
+
 def literal(translator, op):
     """Return the expression as its literal value."""
 
-    dtype = op.output_dtype
-
     if op.value is None:
         return "NULL"
 
-    if dtype.is_boolean():
-        typeclass = 'boolean'
-    elif dtype.is_string():
-        typeclass = 'string'
-    elif dtype.is_date():
-        typeclass = 'date'
-    elif dtype.is_numeric():
-        typeclass = 'number'
-    elif dtype.is_timestamp():
-        typeclass = 'timestamp'
-    elif dtype.is_interval():
-        typeclass = 'interval'
-    elif dtype.is_set():
-        typeclass = 'set'
-    else:
+    dtype = op.output_dtype
+    formatter = _literal_formatter(type(dtype))
+    if formatter is None:
         raise NotImplementedError(f'Unsupported type: {dtype!r}')
 
-    return literal_formatters[typeclass](translator, op)
+    return formatter(translator, op)
 
 
 def null_literal(translator, expr):
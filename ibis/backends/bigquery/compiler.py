@@ -13,6 +13,8 @@ import ibis.expr.types as ir
 from ibis.backends.base.sql import compiler as sql_compiler
 from ibis.backends.bigquery import operations, registry, rewrites
 
+_VALID_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z_0-9]*$")
+
 
 class BigQueryUDFDefinition(sql_compiler.DDL):
     """Represents definition of a temporary UDF."""
@@ -68,7 +70,7 @@ class BigQueryExprTranslator(sql_compiler.ExprTranslator):
 
     _registry = registry.OPERATION_REGISTRY
     _rewrites = rewrites.REWRITES
-    _valid_name_pattern = re.compile(r"^[A-Za-z][A-Za-z_0-9]*$")
+    _valid_name_pattern = _VALID_NAME_RE
 
     _forbids_frame_clause = (
         *sql_compiler.ExprTranslator._forbids_frame_clause,
@@ -111,7 +113,7 @@ def _rewrite_notany(op):
 
 class BigQueryTableSetFormatter(sql_compiler.TableSetFormatter):
     def _quote_identifier(self, name):
-        if re.match(r"^[A-Za-z][A-Za-z_0-9]*$", name):
+        if _VALID_NAME_RE.match(name) is not None:
             return name
         return f"`{name}`"
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import base64
 import datetime
-from typing import Literal
-
-import numpy as np
-from multipledispatch import Dispatcher
+import functools
+import math
+import operator
+import sys
+from binascii import b2a_base64
+from typing import Callable, Literal
 
 import ibis
 import ibis.common.exceptions as com
@@ -25,46 +26,89 @@ from ibis.backends.bigquery.datatypes import ibis_type_to_bigquery_type
 from ibis.common.enums import DateUnit, IntervalUnit, TimeUnit
 
 
-def _extract_field(sql_attr):
-    def extract_field_formatter(translator, op):
-        arg = translator.translate(op.args[0])
-        if sql_attr == "epochseconds":
-            return f"UNIX_SECONDS({arg})"
-        else:
-            return f"EXTRACT({sql_attr} from {arg})"
+# dtypes are immutable and hashable, and a query uses only a handful of them
+@functools.lru_cache(maxsize=256)
+def _ibis_to_bq(dtype: dt.DataType) -> str:
+    # composite names (ARRAY<...>, STRUCT<...>) are built fresh for each dtype;
+    # intern them so equal names produced for distinct dtypes share storage
+    return sys.intern(ibis_type_to_bigquery_type(dtype))
+
+
+_EXTRACT_FIELDS = {
+    ops.ExtractYear: "year",
+    ops.ExtractQuarter: "quarter",
+    ops.ExtractMonth: "month",
+    ops.ExtractWeekOfYear: "isoweek",
+    ops.ExtractDay: "day",
+    ops.ExtractDayOfYear: "dayofyear",
+    ops.ExtractHour: "hour",
+    ops.ExtractMinute: "minute",
+    ops.ExtractSecond: "second",
+    ops.ExtractMillisecond: "millisecond",
+}
+
 
-    return extract_field_formatter
+def _extract_field(translator, op):
+    return f"EXTRACT({_EXTRACT_FIELDS[type(op)]} from {translator.translate(op.arg)})"
 
 
-bigquery_cast = Dispatcher("bigquery_cast")
+def _extract_epoch_seconds(translator, op):
+    return f"UNIX_SECONDS({translator.translate(op.arg)})"
 
 
-@bigquery_cast.register(str, dt.Timestamp, dt.Integer)
 def bigquery_cast_timestamp_to_integer(compiled_arg, from_, to):
     """Convert TIMESTAMP to INT64 (seconds since Unix epoch)."""
     return f"UNIX_MICROS({compiled_arg})"
 
 
-@bigquery_cast.register(str, dt.Integer, dt.Timestamp)
 def bigquery_cast_integer_to_timestamp(compiled_arg, from_, to):
     """Convert INT64 (seconds since Unix epoch) to Timestamp."""
     return f"TIMESTAMP_SECONDS({compiled_arg})"
 
 
-@bigquery_cast.register(str, dt.Interval, dt.Integer)
 def bigquery_cast_interval_to_integer(compiled_arg, from_, to):
     return f"EXTRACT({from_.resolution.upper()} from {compiled_arg})"
 
 
-@bigquery_cast.register(str, dt.DataType, dt.DataType)
 def bigquery_cast_generate(compiled_arg, from_, to):
     """Cast to desired type."""
-    sql_type = ibis_type_to_bigquery_type(to)
+    sql_type = _ibis_to_bq(to)
     return f"CAST({compiled_arg} AS {sql_type})"
 
 
-@bigquery_cast.register(str, dt.DataType)
-def bigquery_cast_generate_simple(compiled_arg, to):
+# Cast implementations keyed on `(type(from_), type(to))`; entries for
+# concrete dtype classes are filled in lazily by `_resolve_bigquery_cast`.
+_BQ_CAST_TABLE: dict[tuple[type, type], Callable[..., str]] = {
+    (dt.Timestamp, dt.Integer): bigquery_cast_timestamp_to_integer,
+    (dt.Integer, dt.Timestamp): bigquery_cast_integer_to_timestamp,
+    (dt.Interval, dt.Integer): bigquery_cast_interval_to_integer,
+    (dt.DataType, dt.DataType): bigquery_cast_generate,
+}
+
+
+def _resolve_bigquery_cast(key: tuple[type, type]) -> Callable[..., str]:
+    from_type, to_type = key
+    for from_base in from_type.__mro__:
+        for to_base in to_type.__mro__:
+            if (func := _BQ_CAST_TABLE.get((from_base, to_base))) is not None:
+                _BQ_CAST_TABLE[key] = func
+                return func
+    raise NotImplementedError(
+        f"Could not find signature for bigquery_cast: <str, {from_type.__name__}, "
+        f"{to_type.__name__}>"
+    )
+
+
+def bigquery_cast(compiled_arg: str, from_: dt.DataType, to: dt.DataType) -> str:
+    """Compile a cast of `compiled_arg` from `from_` to `to`."""
+    key = type(from_), type(to)
+    if (func := _BQ_CAST_TABLE.get(key)) is None:
+        func = _resolve_bigquery_cast(key)
+    return func(compiled_arg, from_, to)
+
+
+def bigquery_cast_simple(compiled_arg: str, to: dt.DataType) -> str:
+    """Compile a cast of `compiled_arg` to `to`."""
     return bigquery_cast(compiled_arg, to, to)
 
 
@@ -101,19 +145,19 @@ def _struct_field(translator, op):
 
 
 def _struct_column(translator, op):
-    cols = (
-        f'{translator.translate(value)} AS {name}'
-        for name, value, in zip(op.names, op.values)
-    )
-    return "STRUCT({})".format(", ".join(cols))
+    values = map(translator.translate, op.values)
+    cols = ", ".join(f"{value} AS {name}" for name, value in zip(op.names, values))
+    return f"STRUCT({cols})"
 
 
 def _array_concat(translator, op):
-    return "ARRAY_CONCAT({})".format(", ".join(map(translator.translate, op.args)))
+    args = ", ".join(map(translator.translate, op.args))
+    return f"ARRAY_CONCAT({args})"
 
 
 def _array_column(translator, op):
-    return "[{}]".format(", ".join(map(translator.translate, op.cols)))
+    cols = ", ".join(map(translator.translate, op.cols))
+    return f"[{cols}]"
 
 
 def _array_index(translator, op):
@@ -142,14 +186,15 @@ def _string_find(translator, op):
     if end is not None:
         raise NotImplementedError("end not implemented for string find")
 
-    return "STRPOS({}, {}) - 1".format(
-        translator.translate(haystack), translator.translate(needle)
-    )
+    haystack = translator.translate(haystack)
+    needle = translator.translate(needle)
+    return f"STRPOS({haystack}, {needle}) - 1"
 
 
 def _translate_pattern(translator, op):
     # add 'r' to string literals to indicate to BigQuery this is a raw string
-    return "r" * isinstance(op, ops.Literal) + translator.translate(op)
+    prefix = "r" if type(op) is ops.Literal else ""
+    return prefix + translator.translate(op)
 
 
 def _regex_search(translator, op):
@@ -181,9 +226,8 @@ def _string_concat(translator, op):
 
 def _string_join(translator, op):
     sep, args = op.args
-    return "ARRAY_TO_STRING([{}], {})".format(
-        ", ".join(map(translator.translate, args)), translator.translate(sep)
-    )
+    args = ", ".join(map(translator.translate, args))
+    return f"ARRAY_TO_STRING([{args}], {translator.translate(sep)})"
 
 
 def _string_ascii(translator, op):
@@ -202,7 +246,6 @@ def _string_substring(translator, op):
         raise ValueError("Length parameter must be a non-negative value.")
 
     arg = translator.translate(op.arg)
-    start = translator.translate(op.start)
 
     arg_length = f"LENGTH({arg})"
     if op.length is not None:
@@ -210,15 +253,18 @@ def _string_substring(translator, op):
     else:
         suffix = ""
 
+    if isinstance(op.start, ops.Literal) and (start := op.start.value) is not None:
+        # the sign of a literal start is known, so only one branch is needed
+        if start >= 0:
+            return f"SUBSTR({arg}, {start + 1}{suffix})"
+        return f"SUBSTR({arg}, {arg_length} - {-start - 1}{suffix})"
+
+    start = translator.translate(op.start)
     if_pos = f"SUBSTR({arg}, {start} + 1{suffix})"
     if_neg = f"SUBSTR({arg}, {arg_length} + {start} + 1{suffix})"
     return f"IF({start} >= 0, {if_pos}, {if_neg})"
 
 
-def _array_literal_format(op):
-    return str(list(op.value))
-
-
 def _log(translator, op):
     arg, base = op.args
     arg_formatted = translator.translate(arg)
@@ -230,58 +276,94 @@ def _log(translator, op):
     return f"log({arg_formatted}, {base_formatted})"
 
 
-def _literal(translator, op):
-    dtype = op.output_dtype
+def _decimal_literal(translator, op):
     value = op.value
+    if value.is_nan():
+        return "CAST('NaN' AS FLOAT64)"
+    if value.is_infinite():
+        prefix = "-" * value.is_signed()
+        return f"CAST('{prefix}inf' AS FLOAT64)"
+    return f"{_ibis_to_bq(op.output_dtype)} '{value}'"
 
-    if value is None:
-        return "NULL"
 
-    if dtype.is_decimal():
-        if value.is_nan():
-            return "CAST('NaN' AS FLOAT64)"
-        if value.is_infinite():
-            prefix = "-" * value.is_signed()
-            return f"CAST('{prefix}inf' AS FLOAT64)"
-        else:
-            return f"{ibis_type_to_bigquery_type(dtype)} '{value}'"
-    elif dtype.is_uuid():
-        return translator.translate(ops.Literal(str(value), dtype=dt.str))
-
-    if isinstance(dtype, dt.Numeric):
-        if not np.isfinite(value):
-            return f"CAST({str(value)!r} AS FLOAT64)"
-
-    # special case literal timestamp, date, and time scalars
-    if isinstance(op, ops.Literal):
-        if isinstance(dtype, dt.Date):
-            if isinstance(value, datetime.datetime):
-                raw_value = value.date()
-            else:
-                raw_value = value
-            return f"DATE '{raw_value}'"
-        elif isinstance(dtype, dt.Timestamp):
-            return f"TIMESTAMP '{value}'"
-        elif isinstance(dtype, dt.Time):
-            # TODO: define extractors on TimeValue expressions
-            return f"TIME '{value}'"
-        elif isinstance(dtype, dt.Binary):
-            return "FROM_BASE64('{}')".format(
-                base64.b64encode(value).decode(encoding="utf-8")
-            )
-        elif dtype.is_struct():
-            cols = (
-                f'{translator.translate(ops.Literal(value[name], dtype=type_))} AS {name}'
-                for name, type_ in zip(dtype.names, dtype.types)
-            )
-            return "STRUCT({})".format(", ".join(cols))
+def _uuid_literal(translator, op):
+    return translator.translate(ops.Literal(str(op.value), dtype=dt.str))
+
+
+def _numeric_literal(translator, op):
+    value = op.value
+    if not math.isfinite(value):
+        return f"CAST({str(value)!r} AS FLOAT64)"
+    return literal(translator, op)
+
+
+def _date_literal(translator, op):
+    value = op.value
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return f"DATE '{value}'"
+
 
+def _timestamp_literal(translator, op):
+    return f"TIMESTAMP '{op.value}'"
+
+
+def _time_literal(translator, op):
+    # TODO: define extractors on TimeValue expressions
+    return f"TIME '{op.value}'"
+
+
+def _binary_literal(translator, op):
+    encoded = b2a_base64(op.value, newline=False).decode("ascii")
+    return f"FROM_BASE64('{encoded}')"
+
+
+def _struct_literal(translator, op):
+    value = op.value
+    dtype = op.output_dtype
+    cols = ", ".join(
+        f'{translator.translate(ops.Literal(value[name], dtype=type_))} AS {name}'
+        for name, type_ in zip(dtype.names, dtype.types)
+    )
+    return f"STRUCT({cols})"
+
+
+def _array_literal(translator, op):
+    return str(list(op.value))
+
+
+# Literal handlers keyed on the dtype class; concrete subclasses are resolved
+# through their MRO on first use and memoized by `_literal_handler`.
+_BQ_LITERAL_HANDLERS: dict[type, Callable[..., str]] = {
+    dt.Decimal: _decimal_literal,
+    dt.UUID: _uuid_literal,
+    dt.Numeric: _numeric_literal,
+    dt.Date: _date_literal,
+    dt.Timestamp: _timestamp_literal,
+    dt.Time: _time_literal,
+    dt.Binary: _binary_literal,
+    dt.Struct: _struct_literal,
+    dt.Array: _array_literal,
+    dt.DataType: literal,
+}
+
+
+def _literal_handler(dtype_class: type) -> Callable[..., str]:
     try:
-        return literal(translator, op)
-    except NotImplementedError:
-        if isinstance(dtype, dt.Array):
-            return _array_literal_format(op)
-        raise NotImplementedError(f'Unsupported type: {dtype!r}')
+        return _BQ_LITERAL_HANDLERS[dtype_class]
+    except KeyError:
+        pass
+    for base in dtype_class.__mro__:
+        if (handler := _BQ_LITERAL_HANDLERS.get(base)) is not None:
+            _BQ_LITERAL_HANDLERS[dtype_class] = handler
+            return handler
+    raise NotImplementedError(f'Unsupported type: {dtype_class!r}')
+
+
+def _literal(translator, op):
+    if op.value is None:
+        return "NULL"
+    return _literal_handler(type(op.output_dtype))(translator, op)
 
 
 def _arbitrary(translator, op):
@@ -299,18 +381,18 @@ def _arbitrary(translator, op):
 
 
 def _truncate(kind, units):
+    sql_units = {
+        unit: "WEEK(MONDAY)" if unit.name == "WEEK" else unit.name for unit in units
+    }
+
     def truncator(translator, op):
         arg, unit = op.args
         trans_arg = translator.translate(arg)
-        if unit not in units:
+        if (sql_unit := sql_units.get(unit)) is None:
             raise com.UnsupportedOperationError(
                 f"BigQuery does not support truncating {arg.output_dtype} values to unit {unit!r}"
             )
-        if unit.name == "WEEK":
-            unit = "WEEK(MONDAY)"
-        else:
-            unit = unit.name
-        return f"{kind}_TRUNC({trans_arg}, {unit})"
+        return f"{kind}_TRUNC({trans_arg}, {sql_unit})"
 
     return truncator
 
@@ -333,6 +415,29 @@ def _timestamp_op(func, units):
     return _formatter
 
 
+def _bitwise_binop(symbol, py_op):
+    def translate(t, op):
+        left, right = op.left, op.right
+        if isinstance(left, ops.Literal) and isinstance(right, ops.Literal):
+            lvalue, rvalue = left.value, right.value
+            # only fold non-negative operands: BigQuery's `>>` does not
+            # sign-extend, unlike python's
+            if (
+                lvalue is not None
+                and rvalue is not None
+                and lvalue >= 0
+                and rvalue >= 0
+            ):
+                value = py_op(lvalue, rvalue)
+                dtype = op.output_dtype
+                lower, upper = dtype.bounds
+                if lower <= value <= upper:
+                    return t.translate(ops.Literal(value, dtype=dtype))
+        return f"{t.translate(left)} {symbol} {t.translate(right)}"
+
+    return translate
+
+
 def _geo_boundingbox(dimension_name):
     def _formatter(translator, op):
         geog = op.args[0]
@@ -386,15 +491,12 @@ def compiles_strftime(translator, op):
     fmt_string = translator.translate(format_str)
     arg_formatted = translator.translate(arg)
     if isinstance(arg_type, dt.Timestamp):
-        return "FORMAT_{}({}, {}, {!r})".format(
-            strftime_format_func_name,
-            fmt_string,
-            arg_formatted,
-            arg_type.timezone if arg_type.timezone is not None else "UTC",
+        timezone = arg_type.timezone if arg_type.timezone is not None else "UTC"
+        return (
+            f"FORMAT_{strftime_format_func_name}"
+            f"({fmt_string}, {arg_formatted}, {timezone!r})"
         )
-    return "FORMAT_{}({}, {})".format(
-        strftime_format_func_name, fmt_string, arg_formatted
-    )
+    return f"FORMAT_{strftime_format_func_name}({fmt_string}, {arg_formatted})"
 
 
 def compiles_string_to_timestamp(translator, op):
@@ -405,7 +507,7 @@ def compiles_string_to_timestamp(translator, op):
 
 
 def compiles_floor(t, op):
-    bigquery_type = ibis_type_to_bigquery_type(op.output_dtype)
+    bigquery_type = _ibis_to_bq(op.output_dtype)
     arg = op.arg
     return f"CAST(FLOOR({t.translate(arg)}) AS {bigquery_type})"
 
@@ -461,7 +563,7 @@ def _identical_to(t, op):
 def _floor_divide(t, op):
     left = t.translate(op.left)
     right = t.translate(op.right)
-    return bigquery_cast(f"FLOOR(IEEE_DIVIDE({left}, {right}))", op.output_dtype)
+    return bigquery_cast_simple(f"FLOOR(IEEE_DIVIDE({left}, {right}))", op.output_dtype)
 
 
 def _log2(t, op):
@@ -477,12 +579,12 @@ def _is_inf(t, op):
 
 
 def _nullifzero(t, op):
-    casted = bigquery_cast('0', op.output_dtype)
+    casted = bigquery_cast_simple('0', op.output_dtype)
     return f"NULLIF({t.translate(op.arg)}, {casted})"
 
 
 def _zeroifnull(t, op):
-    casted = bigquery_cast('0', op.output_dtype)
+    casted = bigquery_cast_simple('0', op.output_dtype)
     return f"COALESCE({t.translate(op.arg)}, {casted})"
 
 
@@ -522,16 +624,13 @@ def _neg_idx_to_pos(array, idx):
 
 def _array_slice(t, op):
     arg = t.translate(op.arg)
-    cond = [f"index >= {_neg_idx_to_pos(arg, t.translate(op.start))}"]
-    if stop := op.stop:
-        cond.append(f"index < {_neg_idx_to_pos(arg, t.translate(stop))}")
-    return (
-        f"ARRAY("
-        f"SELECT el "
-        f"FROM UNNEST({arg}) AS el WITH OFFSET index "
-        f"WHERE {' AND '.join(cond)}"
-        f")"
-    )
+    start = _neg_idx_to_pos(arg, t.translate(op.start))
+    if (stop := op.stop) is not None:
+        stop = _neg_idx_to_pos(arg, t.translate(stop))
+        where = f"index >= {start} AND index < {stop}"
+    else:
+        where = f"index >= {start}"
+    return f"ARRAY(SELECT el FROM UNNEST({arg}) AS el WITH OFFSET index WHERE {where})"
 
 
 def _capitalize(t, op):
@@ -594,11 +693,11 @@ OPERATION_REGISTRY = {
     ops.Modulus: fixed_arity("MOD", 2),
     ops.Sign: unary("SIGN"),
     ops.BitwiseNot: lambda t, op: f"~ {t.translate(op.arg)}",
-    ops.BitwiseXor: lambda t, op: f"{t.translate(op.left)} ^ {t.translate(op.right)}",
-    ops.BitwiseOr: lambda t, op: f"{t.translate(op.left)} | {t.translate(op.right)}",
-    ops.BitwiseAnd: lambda t, op: f"{t.translate(op.left)} & {t.translate(op.right)}",
-    ops.BitwiseLeftShift: lambda t, op: f"{t.translate(op.left)} << {t.translate(op.right)}",
-    ops.BitwiseRightShift: lambda t, op: f"{t.translate(op.left)} >> {t.translate(op.right)}",
+    ops.BitwiseXor: _bitwise_binop("^", operator.xor),
+    ops.BitwiseOr: _bitwise_binop("|", operator.or_),
+    ops.BitwiseAnd: _bitwise_binop("&", operator.and_),
+    ops.BitwiseLeftShift: _bitwise_binop("<<", operator.lshift),
+    ops.BitwiseRightShift: _bitwise_binop(">>", operator.rshift),
     # Temporal functions
     ops.Date: unary("DATE"),
     ops.DateFromYMD: fixed_arity("DATE", 3),
@@ -607,17 +706,8 @@ OPERATION_REGISTRY = {
     ops.DateTruncate: _truncate("DATE", _DATE_UNITS | _INTERVAL_DATE_UNITS),
     ops.DayOfWeekIndex: bigquery_day_of_week_index,
     ops.DayOfWeekName: bigquery_day_of_week_name,
-    ops.ExtractEpochSeconds: _extract_field("epochseconds"),
-    ops.ExtractYear: _extract_field("year"),
-    ops.ExtractQuarter: _extract_field("quarter"),
-    ops.ExtractMonth: _extract_field("month"),
-    ops.ExtractWeekOfYear: _extract_field("isoweek"),
-    ops.ExtractDay: _extract_field("day"),
-    ops.ExtractDayOfYear: _extract_field("dayofyear"),
-    ops.ExtractHour: _extract_field("hour"),
-    ops.ExtractMinute: _extract_field("minute"),
-    ops.ExtractSecond: _extract_field("second"),
-    ops.ExtractMillisecond: _extract_field("millisecond"),
+    ops.ExtractEpochSeconds: _extract_epoch_seconds,
+    **dict.fromkeys(_EXTRACT_FIELDS, _extract_field),
     ops.Strftime: compiles_strftime,
     ops.StringToTimestamp: compiles_string_to_timestamp,
     ops.Time: unary("TIME"),
@@ -735,6 +825,6 @@ _invalid_operations = {
     ops.ExtractUserInfo,
 }
 
-OPERATION_REGISTRY = {
-    k: v for k, v in OPERATION_REGISTRY.items() if k not in _invalid_operations
-}
+for _op in _invalid_operations:
+    OPERATION_REGISTRY.pop(_op, None)
+del _op
@@ -1,2 +1,2 @@
-SELECT IF(3 >= 0, SUBSTR(t0.`value`, 3 + 1, 1), SUBSTR(t0.`value`, LENGTH(t0.`value`) + 3 + 1, 1)) AS `tmp`
+SELECT SUBSTR(t0.`value`, 4, 1) AS `tmp`
 FROM t t0
\ No newline at end of file
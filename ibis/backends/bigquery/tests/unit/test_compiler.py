@@ -213,6 +213,14 @@ def test_substring(snapshot):
     snapshot.assert_match(to_sql(expr), "out.sql")
 
 
+def test_substring_neg_literal_start():
+    t = ibis.table([("value", "string")], name="t")
+    expr = t["value"].substr(-2).name("tmp")
+    assert to_sql(expr) == (
+        "SELECT SUBSTR(t0.`value`, LENGTH(t0.`value`) - 1) AS `tmp`\nFROM t t0"
+    )
+
+
 def test_substring_neg_length():
     t = ibis.table([("value", "string")], name="t")
     expr = t["value"].substr(3, -1).name("tmp")
@@ -222,6 +230,19 @@ def test_substring_neg_length():
         to_sql(expr)
 
 
+@pytest.mark.parametrize(
+    ("expr", "expected"),
+    [
+        param(ibis.literal(1) << 3, "8", id="lshift"),
+        param(ibis.literal(6) & 3, "2", id="and"),
+        param(ibis.literal(1) << 70, "1 << 70", id="lshift_overflow"),
+        param(ibis.literal(-8) >> 1, "-8 >> 1", id="rshift_negative"),
+    ],
+)
+def test_bitwise_literal_folding(expr, expected):
+    assert to_sql(expr.name("tmp")) == f"SELECT {expected} AS `tmp`"
+
+
 def test_bucket(snapshot):
     t = ibis.table([("value", "double")], name="t")
     buckets = [0, 1, 3]
@@ -21,7 +21,7 @@ from packaging.version import parse as vparse
 
 import ibis
 from ibis import util
-from ibis.backends.base import _get_backend_names
+from ibis.backends.base import _get_backend_names, _is_backend_name
 
 SANDBOXED = (
     any(key.startswith("NIX_") for key in os.environ)
@@ -256,7 +256,7 @@ def pytest_ignore_collect(path, config):
     #
     # path is a py.path.local object hence the conversion to Path first
     backend = _get_backend_from_parts(Path(path).parts)
-    if backend is None or backend not in _get_backend_names():
+    if backend is None or not _is_backend_name(backend):
         return False
 
     # we evaluate the marker early so that we don't trigger
@@ -647,6 +647,11 @@ def awards_players(backend):
     return backend.awards_players
 
 
+@pytest.fixture(scope='session')
+def diamonds(backend):
+    return backend.diamonds
+
+
 @pytest.fixture
 def analytic_alltypes(alltypes):
     return alltypes
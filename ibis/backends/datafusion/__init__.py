@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
@@ -73,11 +72,7 @@ class Backend(BaseBackend):
         database: str | None = None,
     ) -> list[str]:
         """List the available tables."""
-        tables = list(self._context.tables())
-        if like is not None:
-            pattern = re.compile(like)
-            return list(filter(lambda t: pattern.findall(t), tables))
-        return tables
+        return self._filter_with_like(self._context.tables(), like)
 
     def table(self, name: str, schema: sch.Schema | None = None) -> ir.Table:
         """Get an ibis expression representing a DataFusion table.
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import operator
-from functools import partial
+from functools import lru_cache, partial
 from typing import Any, Mapping
 
 import numpy as np
 import sqlalchemy as sa
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.functions import GenericFunction
-from toolz.curried import flip
 
+import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 from ibis.backends.base.sql import alchemy
 from ibis.backends.base.sql.alchemy import unary
@@ -32,10 +32,18 @@ from ibis.backends.postgres.registry import (
 )
 from ibis.common.exceptions import UnsupportedOperationError
 
-operation_registry = {
-    op: operation_registry[op]
-    for op in operation_registry.keys() - geospatial_functions.keys()
-}
+operation_registry = operation_registry.copy()
+
+# Constant SQL text fragments; text clauses are immutable, so a single instance
+# can be shared by every translated expression
+_GLOBAL_FLAG = sa.text("'g'")
+_MEDIAN = sa.text(str(0.5))
+_STRING_AGG = sa.text("'string_agg'")
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _sa_text_repr(value):
+    return sa.text(repr(value))
 
 
 def _round(t, op):
@@ -48,12 +56,6 @@ def _round(t, op):
     return sa.func.round(sa_arg, t.translate(digits))
 
 
-_LOG_BASE_FUNCS = {
-    2: sa.func.log2,
-    10: sa.func.log,
-}
-
-
 def _generic_log(arg, base, *, type_):
     return sa.func.ln(arg, type_=type_) / sa.func.ln(base, type_=type_)
 
@@ -62,16 +64,14 @@ def _log(t, op):
     arg, base = op.args
     sqla_type = t.get_sqla_type(op.output_dtype)
     sa_arg = t.translate(arg)
-    if base is not None:
-        sa_base = t.translate(base)
-        try:
-            base_value = sa_base.value
-        except AttributeError:
-            return _generic_log(sa_arg, sa_base, type_=sqla_type)
-        else:
-            func = _LOG_BASE_FUNCS.get(base_value, _generic_log)
-            return func(sa_arg, type_=sqla_type)
-    return sa.func.ln(sa_arg, type_=sqla_type)
+    if base is None:
+        return sa.func.ln(sa_arg, type_=sqla_type)
+    if isinstance(base, ops.Literal):
+        if (base_value := base.value) == 2:
+            return sa.func.log2(sa_arg, type_=sqla_type)
+        elif base_value == 10:
+            return sa.func.log(sa_arg, type_=sqla_type)
+    return _generic_log(sa_arg, t.translate(base), type_=sqla_type)
 
 
 def _timestamp_from_unix(t, op):
@@ -96,85 +96,146 @@ class struct_pack(GenericFunction):
 @compiles(struct_pack, "duckdb")
 def compiles_struct_pack(element, compiler, **kw):
     quote = compiler.preparer.quote
+    process = compiler.process
     args = ", ".join(
-        "{key} := {value}".format(key=quote(key), value=compiler.process(value, **kw))
-        for key, value in element.values.items()
+        [
+            f"{quote(key)} := {process(value, **kw)}"
+            for key, value in element.values.items()
+        ]
     )
     return f"struct_pack({args})"
 
 
+def _interval_literal(t, value, dtype, sqla_type):
+    return sa.literal_column(f"INTERVAL '{value} {dtype.resolution}'")
+
+
+def _array_literal(t, value, dtype, sqla_type):
+    values = value.tolist() if isinstance(value, np.ndarray) else value
+    return sa.cast(sa.func.list_value(*values), sqla_type)
+
+
+def _floating_literal(t, value, dtype, sqla_type):
+    if not np.isfinite(value):
+        if np.isnan(value):
+            value = "NaN"
+        else:
+            assert np.isinf(value), "value is neither finite, nan nor infinite"
+            prefix = "-" * (value < 0)
+            value = f"{prefix}Inf"
+    return sa.cast(sa.literal(value), sqla_type)
+
+
+def _struct_literal(t, value, dtype, sqla_type):
+    return struct_pack(
+        {
+            key: t.translate(ops.Literal(val, dtype=dtype[key]))
+            for key, val in value.items()
+        },
+        type=sqla_type,
+    )
+
+
+def _string_literal(t, value, dtype, sqla_type):
+    return sa.literal(value)
+
+
+def _map_literal(t, value, dtype, sqla_type):
+    return sa.func.map(
+        sa.func.list_value(*value.keys()), sa.func.list_value(*value.values())
+    )
+
+
+def _default_literal(t, value, dtype, sqla_type):
+    return sa.cast(sa.literal(value), sqla_type)
+
+
+# Literal handlers keyed on the dtype class; concrete subclasses are resolved
+# through their MRO on first use and memoized by `_literal_handler`.
+_LITERAL_HANDLERS = {
+    dt.Interval: _interval_literal,
+    dt.Set: _array_literal,
+    dt.Array: _array_literal,
+    dt.Floating: _floating_literal,
+    dt.Struct: _struct_literal,
+    dt.String: _string_literal,
+    dt.Map: _map_literal,
+    dt.DataType: _default_literal,
+}
+
+
+def _literal_handler(dtype_class):
+    try:
+        return _LITERAL_HANDLERS[dtype_class]
+    except KeyError:
+        pass
+    for base in dtype_class.__mro__:
+        if (handler := _LITERAL_HANDLERS.get(base)) is not None:
+            _LITERAL_HANDLERS[dtype_class] = handler
+            return handler
+    raise NotImplementedError(f"Unsupported type: {dtype_class!r}")
+
+
 def _literal(t, op):
-    dtype = op.output_dtype
     value = op.value
 
     if value is None:
         return sa.null()
 
+    dtype = op.output_dtype
     sqla_type = t.get_sqla_type(dtype)
+    return _literal_handler(type(dtype))(t, value, dtype, sqla_type)
 
-    if dtype.is_interval():
-        return sa.literal_column(f"INTERVAL '{value} {dtype.resolution}'")
-    elif dtype.is_set() or dtype.is_array():
-        values = value.tolist() if isinstance(value, np.ndarray) else value
-        return sa.cast(sa.func.list_value(*values), sqla_type)
-    elif dtype.is_floating():
-        if not np.isfinite(value):
-            if np.isnan(value):
-                value = "NaN"
-            else:
-                assert np.isinf(value), "value is neither finite, nan nor infinite"
-                prefix = "-" * (value < 0)
-                value = f"{prefix}Inf"
-        return sa.cast(sa.literal(value), sqla_type)
-    elif dtype.is_struct():
-        return struct_pack(
-            {
-                key: t.translate(ops.Literal(val, dtype=dtype[key]))
-                for key, val in value.items()
-            },
-            type=sqla_type,
-        )
-    elif dtype.is_string():
-        return sa.literal(value)
-    elif dtype.is_map():
-        return sa.func.map(
-            sa.func.list_value(*value.keys()), sa.func.list_value(*value.values())
-        )
-    else:
-        return sa.cast(sa.literal(value), sqla_type)
 
+def _neg_idx_to_pos(array, idx):
+    # a non-negative literal index is already a position, so skip the
+    # runtime sign check and the array_length calls it needs
+    bound = idx.clause if isinstance(idx, sa.sql.elements.Cast) else idx
+    if (
+        isinstance(bound, sa.sql.elements.BindParameter)
+        and isinstance(value := bound.value, int)
+        and value >= 0
+    ):
+        return idx
 
-if_ = getattr(sa.func, "if")
+    arg_length = sa.func.array_length(array)
+    return sa.case(
+        (idx < 0, arg_length + sa.func.greatest(idx, -arg_length)), else_=idx
+    )
 
 
-def _neg_idx_to_pos(array, idx):
-    arg_length = sa.func.array_length(array)
-    return if_(idx < 0, arg_length + sa.func.greatest(idx, -arg_length), idx)
+def _inline_constant(t, op):
+    # DuckDB requires some arguments to be constants, so inline them as text
+    if isinstance(op, ops.Literal):
+        # the value is already known, no need to round trip through sqlalchemy
+        value = op.value
+        if type(value) is str:
+            return sa.text("'" + value.replace("'", "''") + "'")
+        elif type(value) is int:
+            return sa.text(str(value))
+    return sa.text(
+        str(t.translate(op).compile(compile_kwargs=dict(literal_binds=True)))
+    )
 
 
-def _regex_extract(string, pattern, index):
+def _regex_extract(t, op):
+    string = t.translate(op.arg)
+    pattern = t.translate(op.pattern)
     result = sa.case(
         (
             sa.func.regexp_matches(string, pattern),
-            sa.func.regexp_extract(
-                string,
-                pattern,
-                # DuckDB requires the index to be a constant so we compile
-                # the value and inline it using sa.text
-                sa.text(str(index.compile(compile_kwargs=dict(literal_binds=True)))),
-            ),
+            sa.func.regexp_extract(string, pattern, _inline_constant(t, op.index)),
         ),
         else_="",
     )
     return result
 
 
-def _json_get_item(left, path):
+def _json_get_item(t, op):
     # Workaround for https://github.com/duckdb/duckdb/issues/5063
     # In some situations duckdb silently does the wrong thing if
     # the path is parametrized.
-    sa_path = sa.text(str(path.compile(compile_kwargs=dict(literal_binds=True))))
-    return left.op("->")(sa_path)
+    return t.translate(op.arg).op("->")(_inline_constant(t, op.index))
 
 
 def _strftime(t, op):
@@ -183,7 +244,7 @@ def _strftime(t, op):
         raise UnsupportedOperationError(
             f"DuckDB format_str must be a literal `str`; got {type(format_str)}"
         )
-    return sa.func.strftime(t.translate(op.arg), sa.text(repr(format_str_op.value)))
+    return sa.func.strftime(t.translate(op.arg), _sa_text_repr(format_str_op.value))
 
 
 def _arbitrary(t, op):
@@ -199,7 +260,7 @@ def _string_agg(t, op):
         raise UnsupportedOperationError(
             "Separator argument to group_concat operation must be a constant"
         )
-    agg = sa.func.string_agg(t.translate(op.arg), sa.text(repr(op.sep.value)))
+    agg = sa.func.string_agg(t.translate(op.arg), _sa_text_repr(op.sep.value))
     if (where := op.where) is not None:
         return agg.filter(t.translate(where))
     return agg
@@ -207,7 +268,7 @@ def _string_agg(t, op):
 
 def _struct_column(t, op):
     return struct_pack(
-        dict(zip(op.names, map(t.translate, op.values))),
+        {name: t.translate(value) for name, value in zip(op.names, op.values)},
         type=t.get_sqla_type(op.output_dtype),
     )
 
@@ -220,11 +281,16 @@ def _searched_case(t, op):
     return _translate_case(t, op, value=None)
 
 
+@lru_cache(maxsize=None)
+def _duckdb_dialect():
+    return sa.dialects.registry.load("duckdb")()
+
+
 def _translate_case(t, op, *, value):
     return sa.literal_column(
         str(
             _base_translate_case(t, op, value=value).compile(
-                dialect=sa.dialects.registry.load("duckdb")(),
+                dialect=_duckdb_dialect(),
                 compile_kwargs=dict(literal_binds=True),
             )
         ),
@@ -238,10 +304,15 @@ def compiles_list_apply(element, compiler, **kw):
     return f"list_apply({', '.join(args)}, {signature} -> {result})"
 
 
+@lru_cache(maxsize=256)
+def _lambda_parameter(name):
+    return sa.literal_column(f"({name})")
+
+
 def _array_map(t, op):
     return array_map(
         t.translate(op.arg),
-        sa.literal_column(f"({op.parameter})"),
+        _lambda_parameter(op.parameter),
         t.translate(op.result),
     )
 
@@ -255,11 +326,19 @@ def compiles_list_filter(element, compiler, **kw):
 def _array_filter(t, op):
     return array_filter(
         t.translate(op.arg),
-        sa.literal_column(f"({op.parameter})"),
+        _lambda_parameter(op.parameter),
         t.translate(op.result),
     )
 
 
+def _array_remove(t, op):
+    return array_filter(
+        t.translate(op.arg),
+        _lambda_parameter("x"),
+        sa.literal_column("x") != t.translate(op.other),
+    )
+
+
 def _map_keys(t, op):
     m = t.translate(op.arg)
     return sa.cast(
@@ -306,7 +385,7 @@ operation_registry.update(
     {
         ops.ArrayColumn: (
             lambda t, op: sa.cast(
-                sa.func.list_value(*map(t.translate, op.cols)),
+                sa.func.list_value(*[t.translate(col) for col in op.cols]),
                 t.get_sqla_type(op.output_dtype),
             )
         ),
@@ -336,9 +415,7 @@ operation_registry.update(
         ),
         ops.ArrayDistinct: fixed_arity(sa.func.list_distinct, 1),
         ops.ArraySort: fixed_arity(sa.func.list_sort, 1),
-        ops.ArrayRemove: lambda t, op: _array_filter(
-            t, ops.ArrayFilter(op.arg, flip(ops.NotEquals, op.other))
-        ),
+        ops.ArrayRemove: _array_remove,
         ops.ArrayUnion: fixed_arity(
             lambda left, right: sa.func.list_distinct(sa.func.list_cat(left, right)), 2
         ),
@@ -353,7 +430,7 @@ operation_registry.update(
         ops.StructField: (
             lambda t, op: sa.func.struct_extract(
                 t.translate(op.arg),
-                sa.text(repr(op.field)),
+                _sa_text_repr(op.field),
                 type_=t.get_sqla_type(op.output_dtype),
             )
         ),
@@ -365,16 +442,16 @@ operation_registry.update(
             lambda *_: sa.cast(sa.func.now(), sa.TIMESTAMP),
             0,
         ),
-        ops.RegexExtract: fixed_arity(_regex_extract, 3),
+        ops.RegexExtract: _regex_extract,
         ops.RegexReplace: fixed_arity(
-            lambda *args: sa.func.regexp_replace(*args, sa.text("'g'")), 3
+            lambda *args: sa.func.regexp_replace(*args, _GLOBAL_FLAG), 3
         ),
         ops.RegexSearch: fixed_arity(lambda x, y: x.op("SIMILAR TO")(y), 2),
         ops.StringContains: fixed_arity(sa.func.contains, 2),
         ops.ApproxMedian: reduction(
             # without inline text, duckdb fails with
             # RuntimeError: INTERNAL Error: Invalid PhysicalType for GetTypeIdSize
-            lambda arg: sa.func.approx_quantile(arg, sa.text(str(0.5)))
+            lambda arg: sa.func.approx_quantile(arg, _MEDIAN)
         ),
         ops.ApproxCountDistinct: reduction(sa.func.approx_count_distinct),
         ops.Mode: reduction(sa.func.mode),
@@ -385,7 +462,7 @@ operation_registry.update(
         ops.ArgMin: reduction(sa.func.min_by),
         ops.ArgMax: reduction(sa.func.max_by),
         ops.BitwiseXor: fixed_arity(sa.func.xor, 2),
-        ops.JSONGetItem: fixed_arity(_json_get_item, 2),
+        ops.JSONGetItem: _json_get_item,
         ops.RowID: lambda *_: sa.literal_column('rowid'),
         ops.StringToTimestamp: fixed_arity(sa.func.strptime, 2),
         ops.Quantile: reduction(sa.func.quantile_cont),
@@ -395,7 +472,7 @@ operation_registry.update(
         ops.IntervalSubtract: fixed_arity(operator.sub, 2),
         ops.Capitalize: alchemy.sqlalchemy_operation_registry[ops.Capitalize],
         ops.ArrayStringJoin: fixed_arity(
-            lambda sep, arr: sa.func.array_aggr(arr, sa.text("'string_agg'"), sep), 2
+            lambda sep, arr: sa.func.array_aggr(arr, _STRING_AGG, sep), 2
         ),
         ops.SearchedCase: _searched_case,
         ops.SimpleCase: _simple_case,
@@ -434,6 +511,6 @@ _invalid_operations = {
     ops.ToJSONArray,
 }
 
-operation_registry = {
-    k: v for k, v in operation_registry.items() if k not in _invalid_operations
-}
+for _op in geospatial_functions.keys() | _invalid_operations:
+    operation_registry.pop(_op, None)
+del _op
@@ -13,6 +13,8 @@ from ibis.backends.base.sql.alchemy import BaseAlchemyBackend
 from ibis.backends.mysql.compiler import MySQLCompiler
 from ibis.backends.mysql.datatypes import _type_from_cursor_info
 
+_SELECT_RE = re.compile(r"^\s*SELECT\s", flags=re.MULTILINE | re.IGNORECASE)
+
 
 class Backend(BaseAlchemyBackend):
     name = 'mysql'
@@ -114,10 +116,7 @@ class Backend(BaseAlchemyBackend):
         super().do_connect(engine)
 
     def _metadata(self, query: str) -> Iterable[tuple[str, dt.DataType]]:
-        if (
-            re.search(r"^\s*SELECT\s", query, flags=re.MULTILINE | re.IGNORECASE)
-            is not None
-        ):
+        if _SELECT_RE.search(query) is not None:
             query = f"({query})"
 
         with self.begin() as con:
@@ -53,6 +53,10 @@ class BasePandasBackend(BaseBackend):
 
         self.dictionary = dictionary or {}
         self.schemas: MutableMapping[str, sch.Schema] = {}
+        # (source object, converted table) pairs from `create_table`, keyed
+        # by table name; holding references (rather than `id`s) keeps the
+        # identity checks sound
+        self._registered_objs: dict[str, tuple[Any, Any]] = {}
 
     def from_dataframe(
         self,
@@ -139,14 +143,23 @@ class BasePandasBackend(BaseBackend):
         if obj is None and schema is None:
             raise com.IbisError("The schema or obj parameter is required")
 
-        if obj is not None:
+        registered_obj, df = self._registered_objs.get(name, (None, None))
+        # overwriting a table with the same frame it was created from can reuse
+        # the converted copy
+        cached = (
+            overwrite
+            and isinstance(obj, pd.DataFrame)
+            and registered_obj is obj
+            and self.dictionary.get(name) is df
+        )
+        if obj is not None and not cached:
             if not self._supports_conversion(obj):
                 raise com.BackendConversionError(
                     f"Unable to convert {obj.__class__} object "
                     f"to backend type: {self.__class__.backend_table_type}"
                 )
             df = self._convert_object(obj)
-        else:
+        elif obj is None:
             pandas_schema = self._convert_schema(schema)
             dtypes = dict(pandas_schema)
             df = self._from_pandas(pd.DataFrame(columns=dtypes.keys()).astype(dtypes))
@@ -155,6 +168,10 @@ class BasePandasBackend(BaseBackend):
             raise com.IbisError(f"Cannot overwrite existing table `{name}`")
 
         self.dictionary[name] = df
+        if isinstance(obj, pd.DataFrame):
+            self._registered_objs[name] = obj, df
+        else:
+            self._registered_objs.pop(name, None)
 
         if schema is not None:
             self.schemas[name] = schema
@@ -181,6 +198,7 @@ class BasePandasBackend(BaseBackend):
                 "Cannot drop existing table. Call drop_table with force=True to drop existing table."
             )
         del self.dictionary[name]
+        self._registered_objs.pop(name, None)
 
     @classmethod
     def _supports_conversion(cls, obj: Any) -> bool:
@@ -219,6 +237,7 @@ class BasePandasBackend(BaseBackend):
         )
 
     @classmethod
+    @lru_cache
     def has_operation(cls, operation: type[ops.Value]) -> bool:
         # Pandas doesn't support geospatial ops, but the dispatcher implements
         # a common base class that makes it appear that it does. Explicitly
@@ -226,9 +245,9 @@ class BasePandasBackend(BaseBackend):
         if issubclass(operation, (ops.GeoSpatialUnOp, ops.GeoSpatialBinOp)):
             return False
         op_classes = cls._get_operations()
-        return operation in op_classes or any(
-            issubclass(operation, op_impl) for op_impl in op_classes
-        )
+        # an operation is supported if it or any of its bases has an
+        # implementation, which only requires probing the (short) MRO
+        return any(base in op_classes for base in operation.__mro__)
 
     def _clean_up_cached_table(self, op):
         del self.dictionary[op.name]
@@ -289,7 +308,7 @@ class Backend(BasePandasBackend):
 
         node = query.op()
 
-        if params is None:
+        if not params:
             params = {}
         else:
             params = {
@@ -51,6 +51,30 @@ def test_create_table(client, test_data):
     assert 'testingschema' in client.list_tables()
 
 
+def test_create_table_reregister_same_object(client, test_data):
+    client.create_table('testing', obj=test_data)
+    first = client.dictionary['testing']
+
+    client.create_table('testing', obj=test_data, overwrite=True)
+    assert client.dictionary['testing'] is first
+
+    other = test_data.copy()
+    client.create_table('testing', obj=other, overwrite=True)
+    assert client.dictionary['testing'] is not first
+
+
+def test_create_table_reregister_same_dict(client, test_data):
+    data = test_data.to_dict('list')
+    client.create_table('testing', obj=data, overwrite=True)
+    first = client.dictionary['testing']
+
+    # the dict may have been mutated since it was converted
+    data['A'] = data['A'][::-1]
+    client.create_table('testing', obj=data, overwrite=True)
+    assert client.dictionary['testing'] is not first
+    assert client.dictionary['testing']['A'].tolist() == data['A']
+
+
 def test_literal(client):
     lit = ibis.literal(1)
     result = client.execute(lit)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import concurrent.futures
+import functools
 import inspect
 import subprocess
 from pathlib import Path
@@ -92,6 +93,7 @@ class BackendTest(abc.ABC):
         return f'<BackendTest {self.name()}>'
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def name(cls) -> str:
         backend_tests_path = inspect.getmodule(cls).__file__
         return Path(backend_tests_path).resolve().parent.parent.name
@@ -1,6 +1,7 @@
 import pytest
 from pytest import param
 
+import ibis
 import ibis.expr.types as ir
 from ibis.backends.conftest import TEST_TABLES
 
@@ -90,6 +91,15 @@ def test_tables_accessor_getattr(con):
         con.tables._private_attr  # noqa: B018
 
 
+def test_tables_accessor_getattr_skips_list_tables(con, mocker):
+    spy = mocker.spy(con, "list_tables")
+
+    with pytest.raises(AttributeError, match="doesnt_exist"):
+        con.tables.doesnt_exist  # noqa: B018
+
+    assert not spy.called
+
+
 def test_tables_accessor_tab_completion(con):
     attrs = dir(con.tables)
     assert 'functional_alltypes' in attrs or "FUNCTIONAL_ALLTYPES" in attrs
@@ -104,6 +114,32 @@ def test_tables_accessor_repr(con):
     assert '- functional_alltypes' in result or '- FUNCTIONAL_ALLTYPES' in result
 
 
+def test_tables_accessor_lists_once_per_use(con, mocker):
+    tables = con.tables
+    spy = mocker.spy(con, "list_tables")
+
+    assert len(list(tables)) == len(con.list_tables())
+    assert spy.call_count == 2
+
+    dir(tables)
+    repr(tables)
+    assert spy.call_count == 4
+
+
+@pytest.mark.notimpl(["datafusion", "polars", "druid"])
+def test_tables_accessor_sees_new_tables(con, temp_table):
+    tables = con.tables
+    assert temp_table not in list(tables)
+
+    con.create_table(temp_table, schema=ibis.schema(dict(a="int64")))
+    assert temp_table in list(tables)
+    assert temp_table in dir(tables)
+
+    con.drop_table(temp_table)
+    assert temp_table not in list(tables)
+    assert temp_table not in dir(tables)
+
+
 @pytest.mark.parametrize(
     "expr_fn",
     [
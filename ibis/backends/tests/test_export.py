@@ -54,6 +54,16 @@ def test_table_to_pyarrow_batches(limit, awards_players):
         assert len(batch) == limit
 
 
+@pytest.mark.parametrize("limit", limit_no_limit)
+@pytest.mark.notimpl(["druid"])
+def test_table_to_arrow_reader(limit, awards_players):
+    reader = awards_players.to_arrow_reader(limit=limit)
+    assert isinstance(reader, pa.ipc.RecordBatchReader)
+    table = reader.read_all()
+    if limit is not None:
+        assert len(table) == limit
+
+
 @pytest.mark.notyet(
     ["pandas"], reason="DataFrames have no option for outputting in batches"
 )
@@ -111,16 +111,14 @@ def test_scalar_fillna_nullif(con, expr, expected):
 
 
 @pytest.mark.parametrize(
-    ("col", "filt"),
+    "filt",
     [
         param(
-            "nan_col",
             _.nan_col.isnan(),
             marks=pytest.mark.notimpl(["datafusion", "mysql", "sqlite"]),
             id="nan_col",
         ),
         param(
-            "none_col",
             _.none_col.isnull(),
             marks=[pytest.mark.notimpl(["datafusion", "mysql"])],
             id="none_col",
@@ -128,16 +126,17 @@ def test_scalar_fillna_nullif(con, expr, expected):
     ],
 )
 @pytest.mark.notimpl(["mssql", "druid"])
-def test_isna(backend, alltypes, col, filt):
+def test_isna(backend, alltypes, filt):
     table = alltypes.select(
         nan_col=ibis.literal(np.nan), none_col=ibis.NA.cast("float64")
     )
-    df = table.execute()
 
-    result = table[filt].execute().reset_index(drop=True)
-    expected = df[df[col].isna()].reset_index(drop=True)
+    # every row of the column is missing, so the filter must keep all of them;
+    # compare counts computed by the backend instead of materializing the rows
+    result = table[filt].count().execute()
+    expected = table.count().execute()
 
-    backend.assert_frame_equal(result, expected)
+    assert result == expected
 
 
 @pytest.mark.parametrize(
@@ -171,7 +170,7 @@ def test_column_fillna(backend, alltypes, value):
 
     res = table.mutate(missing=table.missing.fillna(0.0)).execute()
     sol = pd_table.assign(missing=pd_table.missing.fillna(0.0))
-    backend.assert_frame_equal(res.reset_index(drop=True), sol.reset_index(drop=True))
+    backend.assert_frame_equal(res, sol)
 
 
 @pytest.mark.parametrize(
@@ -191,16 +190,27 @@ def test_coalesce(con, expr, expected):
         # >>> decimal.Decimal('5.56') == 5.56
         # False
         assert result == decimal.Decimal(str(expected))
+    elif isinstance(expected, int):
+        assert result == expected
     else:
         assert result == pytest.approx(expected)
 
 
+ISIN_ELEMENTS = [
+    param('int_col', [1, 2, 3], id="int_list"),
+    param('int_col', (1, 2, 3), id="int_tuple"),
+    param('string_col', ['1', '2', '3'], id="string_list"),
+    param('string_col', ('1', '2', '3'), id="string_tuple"),
+    param('int_col', {1}, id="int_set"),
+    param('int_col', frozenset({1}), id="int_frozenset"),
+]
+
+
 # TODO(dask) - identicalTo - #2553
 @pytest.mark.notimpl(
     ["clickhouse", "datafusion", "polars", "dask", "pyspark", "mssql", "druid"]
 )
-def test_identical_to(backend, alltypes, sorted_df):
-    sorted_alltypes = alltypes.order_by('id')
+def test_identical_to(backend, sorted_alltypes, sorted_df):
     df = sorted_df
     dt = df[['tinyint_col', 'double_col']]
 
@@ -217,49 +227,31 @@ def test_identical_to(backend, alltypes, sorted_df):
 
 
 @pytest.mark.parametrize(
-    ('column', 'elements'),
-    [
-        ('int_col', [1, 2, 3]),
-        ('int_col', (1, 2, 3)),
-        ('string_col', ['1', '2', '3']),
-        ('string_col', ('1', '2', '3')),
-        ('int_col', {1}),
-        ('int_col', frozenset({1})),
-    ],
-)
-@pytest.mark.notimpl(["mssql", "druid"])
-def test_isin(backend, alltypes, sorted_df, column, elements):
-    sorted_alltypes = alltypes.order_by('id')
-    expr = sorted_alltypes[
-        'id', sorted_alltypes[column].isin(elements).name('tmp')
-    ].order_by('id')
-    result = expr.execute().tmp
-
-    expected = sorted_df[column].isin(elements)
-    expected = backend.default_series_rename(expected)
-    backend.assert_series_equal(result, expected)
-
-
-@pytest.mark.parametrize(
-    ('column', 'elements'),
+    ("ibis_op", "pandas_op"),
     [
-        ('int_col', [1, 2, 3]),
-        ('int_col', (1, 2, 3)),
-        ('string_col', ['1', '2', '3']),
-        ('string_col', ('1', '2', '3')),
-        ('int_col', {1}),
-        ('int_col', frozenset({1})),
+        param(
+            lambda c, elements: c.isin(elements),
+            lambda ser, elements: ser.isin(elements),
+            id="isin",
+        ),
+        param(
+            lambda c, elements: c.notin(elements),
+            lambda ser, elements: ~ser.isin(elements),
+            id="notin",
+        ),
     ],
 )
+@pytest.mark.parametrize(('column', 'elements'), ISIN_ELEMENTS)
 @pytest.mark.notimpl(["mssql", "druid"])
-def test_notin(backend, alltypes, sorted_df, column, elements):
-    sorted_alltypes = alltypes.order_by('id')
+def test_isin(
+    backend, sorted_alltypes, sorted_df, column, elements, ibis_op, pandas_op
+):
     expr = sorted_alltypes[
-        'id', sorted_alltypes[column].notin(elements).name('tmp')
+        'id', ibis_op(sorted_alltypes[column], elements).name('tmp')
     ].order_by('id')
     result = expr.execute().tmp
 
-    expected = ~sorted_df[column].isin(elements)
+    expected = pandas_op(sorted_df[column], elements)
     expected = backend.default_series_rename(expected)
     backend.assert_series_equal(result, expected)
 
@@ -293,8 +285,7 @@ def test_notin(backend, alltypes, sorted_df, column, elements):
     ],
 )
 @pytest.mark.notimpl(["druid"])
-def test_filter(backend, alltypes, sorted_df, predicate_fn, expected_fn):
-    sorted_alltypes = alltypes.order_by('id')
+def test_filter(backend, sorted_alltypes, sorted_df, predicate_fn, expected_fn):
     table = sorted_alltypes[predicate_fn(sorted_alltypes)].order_by('id')
     result = table.execute()
     expected = sorted_df[expected_fn(sorted_df)]
@@ -319,17 +310,12 @@ def test_filter(backend, alltypes, sorted_df, predicate_fn, expected_fn):
         "druid",
     ]
 )
-def test_filter_with_window_op(backend, alltypes, sorted_df):
-    sorted_alltypes = alltypes.order_by('id')
+def test_filter_with_window_op(backend, sorted_alltypes, sorted_df):
     table = sorted_alltypes
     window = ibis.window(group_by=table.id)
     table = table.filter(lambda t: t['id'].mean().over(window) > 3).order_by('id')
     result = table.execute()
-    expected = (
-        sorted_df.groupby(['id'])
-        .filter(lambda t: t['id'].mean() > 3)
-        .reset_index(drop=True)
-    )
+    expected = sorted_df.groupby(['id']).filter(lambda t: t['id'].mean() > 3)
     backend.assert_frame_equal(result, expected)
 
 
@@ -409,6 +395,15 @@ def test_table_fillna_invalid(alltypes):
         alltypes.fillna({"int_col": "oops"})
 
 
+@pytest.fixture(scope="module")
+def fillna_table(alltypes):
+    return alltypes.mutate(
+        int_col=alltypes.int_col.nullif(1),
+        double_col=alltypes.double_col.nullif(3.0),
+        string_col=alltypes.string_col.nullif("2"),
+    ).select("id", "int_col", "double_col", "string_col")
+
+
 @pytest.mark.parametrize(
     "replacements",
     [
@@ -418,42 +413,33 @@ def test_table_fillna_invalid(alltypes):
     ],
 )
 @pytest.mark.notimpl(["datafusion", "mssql", "clickhouse", "druid"])
-def test_table_fillna_mapping(backend, alltypes, replacements):
-    table = alltypes.mutate(
-        int_col=alltypes.int_col.nullif(1),
-        double_col=alltypes.double_col.nullif(3.0),
-        string_col=alltypes.string_col.nullif("2"),
-    ).select("id", "int_col", "double_col", "string_col")
-    pd_table = table.execute()
+def test_table_fillna_mapping(backend, fillna_table, replacements):
+    pd_table = fillna_table.execute()
 
-    result = table.fillna(replacements).execute().reset_index(drop=True)
-    expected = pd_table.fillna(replacements).reset_index(drop=True)
+    result = fillna_table.fillna(replacements).execute()
+    expected = pd_table.fillna(replacements)
 
     backend.assert_frame_equal(result, expected, check_dtype=False)
 
 
 @pytest.mark.notimpl(["datafusion", "mssql", "clickhouse", "druid"])
-def test_table_fillna_scalar(backend, alltypes):
-    table = alltypes.mutate(
-        int_col=alltypes.int_col.nullif(1),
-        double_col=alltypes.double_col.nullif(3.0),
-        string_col=alltypes.string_col.nullif("2"),
-    ).select("id", "int_col", "double_col", "string_col")
+def test_table_fillna_scalar(backend, fillna_table):
+    table = fillna_table
     pd_table = table.execute()
 
-    res = table[["int_col", "double_col"]].fillna(0).execute().reset_index(drop=True)
-    sol = pd_table[["int_col", "double_col"]].fillna(0).reset_index(drop=True)
+    res = table[["int_col", "double_col"]].fillna(0).execute()
+    sol = pd_table[["int_col", "double_col"]].fillna(0)
     backend.assert_frame_equal(res, sol, check_dtype=False)
 
-    res = table[["string_col"]].fillna("missing").execute().reset_index(drop=True)
-    sol = pd_table[["string_col"]].fillna("missing").reset_index(drop=True)
+    res = table[["string_col"]].fillna("missing").execute()
+    sol = pd_table[["string_col"]].fillna("missing")
     backend.assert_frame_equal(res, sol, check_dtype=False)
 
 
 def test_mutate_rename(alltypes):
     table = alltypes.select(["bool_col", "string_col"])
     table = table.mutate(dupe_col=table["bool_col"])
-    result = table.execute()
+    result = table.limit(1).execute()
     # check_dtype is False here because there are dtype diffs between
     # Pyspark and Pandas on Java 8 - filling the 'none_col' with an int
     # results in float in Pyspark, and int in Pandas. This diff does
@@ -471,27 +457,30 @@ def test_dropna_invalid(alltypes):
         alltypes.dropna(how='invalid')
 
 
-@pytest.mark.parametrize(
-    'how', ['any', pytest.param('all', marks=pytest.mark.notyet("polars"))]
-)
-@pytest.mark.parametrize(
-    'subset', [None, [], 'col_1', ['col_1', 'col_2'], ['col_1', 'col_3']]
-)
-@pytest.mark.notimpl(["datafusion"])
-def test_dropna_table(backend, alltypes, how, subset):
+@pytest.fixture(scope="module")
+def dropna_table(alltypes):
     is_two = alltypes.int_col == 2
     is_four = alltypes.int_col == 4
 
-    table = alltypes.mutate(
+    return alltypes.mutate(
         col_1=is_two.ifelse(ibis.NA, alltypes.float_col),
         col_2=is_four.ifelse(ibis.NA, alltypes.float_col),
         col_3=(is_two | is_four).ifelse(ibis.NA, alltypes.float_col),
     ).select("col_1", "col_2", "col_3")
 
-    table_pandas = table.execute()
 
-    result = table.dropna(subset, how).execute().reset_index(drop=True)
-    expected = table_pandas.dropna(how=how, subset=subset).reset_index(drop=True)
+@pytest.mark.parametrize(
+    'how', ['any', pytest.param('all', marks=pytest.mark.notyet("polars"))]
+)
+@pytest.mark.parametrize(
+    'subset', [None, [], 'col_1', ['col_1', 'col_2'], ['col_1', 'col_3']]
+)
+@pytest.mark.notimpl(["datafusion"])
+def test_dropna_table(backend, dropna_table, how, subset):
+    table_pandas = dropna_table.execute()
+
+    result = dropna_table.dropna(subset, how).execute()
+    expected = table_pandas.dropna(how=how, subset=subset)
 
     backend.assert_frame_equal(result, expected)
 
@@ -596,8 +585,8 @@ def test_table_info(alltypes):
 )
 def test_isin_notin(backend, alltypes, df, ibis_op, pandas_op):
     expr = alltypes[ibis_op]
-    expected = df.loc[pandas_op(df)].sort_values(["id"]).reset_index(drop=True)
-    result = expr.execute().sort_values(["id"]).reset_index(drop=True)
+    expected = df.loc[pandas_op(df)].sort_values(["id"])
+    result = expr.execute().sort_values(["id"])
     backend.assert_frame_equal(result, expected)
 
 
@@ -634,7 +623,7 @@ def test_isin_notin(backend, alltypes, df, ibis_op, pandas_op):
 )
 def test_isin_notin_column_expr(backend, alltypes, df, ibis_op, pandas_op):
     expr = alltypes[ibis_op].order_by("id")
-    expected = df[pandas_op(df)].sort_values(["id"]).reset_index(drop=True)
+    expected = df[pandas_op(df)].sort_values(["id"])
     result = expr.execute()
     backend.assert_frame_equal(result, expected)
 
@@ -736,7 +725,7 @@ def test_select_filter(backend, alltypes, df):
     expr = t.select("int_col").filter(t.string_col == "4")
     result = expr.execute()
 
-    expected = df.loc[df.string_col == "4", ["int_col"]].reset_index(drop=True)
+    expected = df.loc[df.string_col == "4", ["int_col"]]
     backend.assert_frame_equal(result, expected)
 
 
@@ -791,7 +780,7 @@ def test_uncorrelated_subquery(backend, batting, batting_df):
 
 
 def test_int_column(alltypes):
-    expr = alltypes.mutate(x=1).x
+    expr = alltypes.mutate(x=1).limit(1).x
     result = expr.execute()
     assert expr.type() == dt.int8
     assert result.dtype == np.int8
@@ -880,13 +869,9 @@ def test_isin_uncorrelated_filter(
         .order_by(["playerID", "yearID"])
     )
     result = expr.execute()
-    expected = (
-        batting_df.loc[
-            batting_df.yearID.isin(awards_players_df.yearID), ["playerID", "yearID"]
-        ]
-        .sort_values(["playerID", "yearID"])
-        .reset_index(drop=True)
-    )
+    expected = batting_df.loc[
+        batting_df.yearID.isin(awards_players_df.yearID), ["playerID", "yearID"]
+    ].sort_values(["playerID", "yearID"])
     backend.assert_frame_equal(result, expected)
 
 
@@ -980,9 +965,7 @@ def test_many_subqueries(con, snapshot):
     reason="backend doesn't support arrays and we don't implement pivot_longer with unions yet",
     raises=com.OperationNotDefinedError,
 )
-def test_pivot_longer(backend):
-    diamonds = backend.diamonds
-    df = diamonds.execute()
+def test_pivot_longer(diamonds):
     res = diamonds.pivot_longer(s.c("x", "y", "z"), names_to="pos", values_to="xyz")
     assert res.schema().names == (
         "carat",
@@ -995,27 +978,12 @@ def test_pivot_longer(backend):
         "pos",
         "xyz",
     )
-    expected = pd.melt(
-        df,
-        id_vars=[
-            "carat",
-            "cut",
-            "color",
-            "clarity",
-            "depth",
-            "table",
-            "price",
-        ],
-        value_vars=list('xyz'),
-        var_name="pos",
-        value_name="xyz",
-    )
-    assert len(res.execute()) == len(expected)
+    # each row is unpivoted into one row per value column
+    assert len(res.execute()) == diamonds.count().execute() * 3
 
 
 @pytest.mark.notyet(["datafusion"], raises=com.OperationNotDefinedError)
-def test_pivot_wider(backend):
-    diamonds = backend.diamonds
+def test_pivot_wider(diamonds):
     expr = (
         diamonds.group_by(["cut", "color"])
         .agg(carat=_.carat.mean())
@@ -1030,6 +998,13 @@ def test_pivot_wider(backend):
     assert len(df) == diamonds.color.nunique().execute()
 
 
+@pytest.fixture(scope="module")
+def diamonds_with_idx(diamonds):
+    return diamonds.mutate(one=ibis.literal(1)).mutate(
+        idx=ibis.row_number().over(order_by=_.one, rows=(None, 0))
+    )
+
+
 @pytest.mark.parametrize(
     "on",
     [
@@ -1082,12 +1057,8 @@ def test_pivot_wider(backend):
     raises=com.OperationNotDefinedError,
     reason="backend doesn't implement ops.WindowFunction",
 )
-def test_distinct_on_keep(backend, on, keep):
-    from ibis import _
-
-    t = backend.diamonds.mutate(one=ibis.literal(1)).mutate(
-        idx=ibis.row_number().over(order_by=_.one, rows=(None, 0))
-    )
+def test_distinct_on_keep(backend, diamonds_with_idx, on, keep):
+    t = diamonds_with_idx
 
     requires_cache = backend.name() in ("mysql", "impala")
 
@@ -1096,11 +1067,7 @@ def test_distinct_on_keep(backend, on, keep):
     expr = t.distinct(on=on, keep=keep).order_by(ibis.asc("idx"))
     result = expr.execute()
     df = t.execute()
-    expected = (
-        df.drop_duplicates(subset=on, keep=keep or False)
-        .sort_values(by=["idx"])
-        .reset_index(drop=True)
-    )
+    expected = df.drop_duplicates(subset=on, keep=keep or False).sort_values(by=["idx"])
     assert len(result) == len(expected)
 
 
@@ -1147,12 +1114,8 @@ def test_distinct_on_keep(backend, on, keep):
     raises=com.UnsupportedOperationError,
     reason="backend doesn't support `having` filters",
 )
-def test_distinct_on_keep_is_none(backend, on):
-    from ibis import _
-
-    t = backend.diamonds.mutate(one=ibis.literal(1)).mutate(
-        idx=ibis.row_number().over(order_by=_.one, rows=(None, 0))
-    )
+def test_distinct_on_keep_is_none(backend, diamonds_with_idx, on):
+    t = diamonds_with_idx
 
     requires_cache = backend.name() in ("mysql", "impala")
 
@@ -1161,9 +1124,5 @@ def test_distinct_on_keep_is_none(backend, on):
     expr = t.distinct(on=on, keep=None).order_by(ibis.asc("idx"))
     result = expr.execute()
     df = t.execute()
-    expected = (
-        df.drop_duplicates(subset=on, keep=False)
-        .sort_values(by=["idx"])
-        .reset_index(drop=True)
-    )
+    expected = df.drop_duplicates(subset=on, keep=False).sort_values(by=["idx"])
     assert len(result) == len(expected)
@@ -51,7 +51,13 @@ def sub_for(node: ops.Node, substitutions: Mapping[ops.node, ops.Node]) -> ops.N
 
 def sub_immediate_parents(op: ops.Node, table: ops.TableNode) -> ops.Node:
     """Replace immediate parent tables in `op` with `table`."""
-    return sub_for(op, {base: table for base in find_immediate_parent_tables(op)})
+    substitutions = {
+        base: table for base in find_immediate_parent_tables(op) if base != table
+    }
+    if not substitutions:
+        # `op` is already defined on top of `table`
+        return op
+    return sub_for(op, substitutions)
 
 
 class ScalarAggregate:
@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import datetime as pydatetime
 import decimal as pydecimal
+import functools
+import itertools
 import numbers
 import uuid as pyuuid
+import weakref
 from abc import abstractmethod
 from collections.abc import Iterator, Mapping, Sequence
 from collections.abc import Set as PySet
 from numbers import Integral, Real
+from types import MappingProxyType
 from typing import Any, Iterable, Literal, NamedTuple, Optional
 
 import numpy as np
-import toolz
 from multipledispatch import Dispatcher
 from public import public
 from typing_extensions import get_args, get_origin, get_type_hints
@@ -26,9 +29,31 @@ from ibis.common.validators import Coercible
 
 dtype = Dispatcher('dtype')
 
+_kind_bits = itertools.count()
+
+
+# datatypes of the python types seen by `dtype_from_object`, held weakly so
+# that dynamically created classes can still be garbage collected
+_type_dtypes = weakref.WeakKeyDictionary()
+
 
 @dtype.register(object)
 def dtype_from_object(value, **kwargs) -> DataType:
+    if isinstance(value, type):
+        try:
+            return _type_dtypes[value]
+        except KeyError:
+            result = _type_dtypes[value] = _dtype_from_object(value)
+            return result
+    try:
+        hash(value)
+    except TypeError:
+        # unhashable values can't be memoized
+        return _dtype_from_object(value)
+    return _typehint_dtype(value)
+
+
+def _dtype_from_object(value) -> DataType:
     # TODO(kszucs): implement this in a @dtype.register(type) overload once dtype
     # turned into a singledispatched function because that overload doesn't work
     # with multipledispatch
@@ -36,29 +61,24 @@ def dtype_from_object(value, **kwargs) -> DataType:
     # TODO(kszucs): support Tuple[int, str] and Tuple[int, ...] typehints
     # in order to support more kinds of typehints follow the implementation of
     # Validator.from_annotation
+    if isinstance(value, type):
+        # bare python types are by far the most common input
+        if (result := _python_dtypes.get(value)) is not None:
+            return result
+
     origin_type = get_origin(value)
     if origin_type is None:
         if isinstance(value, type):
             if issubclass(value, DataType):
                 return value()
-            elif result := _python_dtypes.get(value):
-                return result
             elif annots := get_type_hints(value):
-                return Struct(toolz.valmap(dtype, annots))
-            elif issubclass(value, bytes):
-                return bytes
-            elif issubclass(value, str):
-                return string
-            elif issubclass(value, Integral):
-                return int64
-            elif issubclass(value, Real):
-                return float64
-            elif value is type(None):
-                return null
-            else:
-                raise TypeError(
-                    f"Cannot construct an ibis datatype from python type `{value!r}`"
-                )
+                return Struct({name: dtype(typ) for name, typ in annots.items()})
+            for base, result in _python_base_dtypes:
+                if issubclass(value, base):
+                    return result
+            raise TypeError(
+                f"Cannot construct an ibis datatype from python type `{value!r}`"
+            )
         else:
             raise TypeError(
                 f"Cannot construct an ibis datatype from python value `{value!r}`"
@@ -76,6 +96,11 @@ def dtype_from_object(value, **kwargs) -> DataType:
         raise TypeError(f'Value {value!r} is not a valid datatype')
 
 
+# typehints such as `list[int]` are created anew on every subscription, so
+# their datatypes are kept in a bounded cache
+_typehint_dtype = functools.lru_cache(maxsize=256)(_dtype_from_object)
+
+
 @public
 class DataType(Concrete, Coercible):
     """Base class for all data types.
@@ -85,6 +110,23 @@ class DataType(Concrete, Coercible):
 
     nullable: bool = True
 
+    # lazily populated by __str__, datatypes are immutable so the rendered
+    # string can be reused for the lifetime of the instance
+    __slots__ = ("_str_cache",)
+
+    # Bit flags of the class and all of its datatype bases, set for every
+    # subclass in __init_subclass__. The is_* predicates test these bits
+    # instead of going through the comparatively slow ABCMeta isinstance.
+    _kind_bit = 0
+    _kind = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._kind_bit = kind = 1 << next(_kind_bits)
+        for base in cls.__bases__:
+            kind |= getattr(base, "_kind", 0)
+        cls._kind = kind
+
     # TODO(kszucs): remove it, prefer to use Annotable.__repr__ instead
     @property
     def _pretty_piece(self) -> str:
@@ -104,8 +146,13 @@ class DataType(Concrete, Coercible):
         return self.copy(**kwargs)
 
     def __str__(self) -> str:
-        prefix = "!" * (not self.nullable)
-        return f"{prefix}{self.name.lower()}{self._pretty_piece}"
+        try:
+            return self._str_cache
+        except AttributeError:
+            prefix = "!" * (not self.nullable)
+            result = f"{prefix}{self.name.lower()}{self._pretty_piece}"
+            object.__setattr__(self, "_str_cache", result)
+            return result
 
     def equals(self, other):
         if not isinstance(other, DataType):
@@ -139,142 +186,142 @@ class DataType(Concrete, Coercible):
         return to_pyarrow_type(self)
 
     def is_array(self) -> bool:
-        return isinstance(self, Array)
+        return bool(self._kind & Array._kind_bit)
 
     def is_binary(self) -> bool:
-        return isinstance(self, Binary)
+        return bool(self._kind & Binary._kind_bit)
 
     def is_boolean(self) -> bool:
-        return isinstance(self, Boolean)
+        return bool(self._kind & Boolean._kind_bit)
 
     def is_date(self) -> bool:
-        return isinstance(self, Date)
+        return bool(self._kind & Date._kind_bit)
 
     def is_decimal(self) -> bool:
-        return isinstance(self, Decimal)
+        return bool(self._kind & Decimal._kind_bit)
 
     def is_enum(self) -> bool:
-        return isinstance(self, Enum)
+        return bool(self._kind & Enum._kind_bit)
 
     def is_float16(self) -> bool:
-        return isinstance(self, Float16)
+        return bool(self._kind & Float16._kind_bit)
 
     def is_float32(self) -> bool:
-        return isinstance(self, Float32)
+        return bool(self._kind & Float32._kind_bit)
 
     def is_float64(self) -> bool:
-        return isinstance(self, Float64)
+        return bool(self._kind & Float64._kind_bit)
 
     def is_floating(self) -> bool:
-        return isinstance(self, Floating)
+        return bool(self._kind & Floating._kind_bit)
 
     def is_geospatial(self) -> bool:
-        return isinstance(self, GeoSpatial)
+        return bool(self._kind & GeoSpatial._kind_bit)
 
     def is_inet(self) -> bool:
-        return isinstance(self, INET)
+        return bool(self._kind & INET._kind_bit)
 
     def is_int16(self) -> bool:
-        return isinstance(self, Int16)
+        return bool(self._kind & Int16._kind_bit)
 
     def is_int32(self) -> bool:
-        return isinstance(self, Int32)
+        return bool(self._kind & Int32._kind_bit)
 
     def is_int64(self) -> bool:
-        return isinstance(self, Int64)
+        return bool(self._kind & Int64._kind_bit)
 
     def is_int8(self) -> bool:
-        return isinstance(self, Int8)
+        return bool(self._kind & Int8._kind_bit)
 
     def is_integer(self) -> bool:
-        return isinstance(self, Integer)
+        return bool(self._kind & Integer._kind_bit)
 
     def is_interval(self) -> bool:
-        return isinstance(self, Interval)
+        return bool(self._kind & Interval._kind_bit)
 
     def is_json(self) -> bool:
-        return isinstance(self, JSON)
+        return bool(self._kind & JSON._kind_bit)
 
     def is_linestring(self) -> bool:
-        return isinstance(self, LineString)
+        return bool(self._kind & LineString._kind_bit)
 
     def is_macaddr(self) -> bool:
-        return isinstance(self, MACADDR)
+        return bool(self._kind & MACADDR._kind_bit)
 
     def is_map(self) -> bool:
-        return isinstance(self, Map)
+        return bool(self._kind & Map._kind_bit)
 
     def is_multilinestring(self) -> bool:
-        return isinstance(self, MultiLineString)
+        return bool(self._kind & MultiLineString._kind_bit)
 
     def is_multipoint(self) -> bool:
-        return isinstance(self, MultiPoint)
+        return bool(self._kind & MultiPoint._kind_bit)
 
     def is_multipolygon(self) -> bool:
-        return isinstance(self, MultiPolygon)
+        return bool(self._kind & MultiPolygon._kind_bit)
 
     def is_nested(self) -> bool:
-        return isinstance(self, (Array, Map, Struct, Set))
+        return bool(self._kind & _NESTED_KIND)
 
     def is_null(self) -> bool:
-        return isinstance(self, Null)
+        return bool(self._kind & Null._kind_bit)
 
     def is_numeric(self) -> bool:
-        return isinstance(self, Numeric)
+        return bool(self._kind & Numeric._kind_bit)
 
     def is_point(self) -> bool:
-        return isinstance(self, Point)
+        return bool(self._kind & Point._kind_bit)
 
     def is_polygon(self) -> bool:
-        return isinstance(self, Polygon)
+        return bool(self._kind & Polygon._kind_bit)
 
     def is_primitive(self) -> bool:
-        return isinstance(self, Primitive)
+        return bool(self._kind & Primitive._kind_bit)
 
     def is_set(self) -> bool:
-        return isinstance(self, Set)
+        return bool(self._kind & Set._kind_bit)
 
     def is_signed_integer(self) -> bool:
-        return isinstance(self, SignedInteger)
+        return bool(self._kind & SignedInteger._kind_bit)
 
     def is_string(self) -> bool:
-        return isinstance(self, String)
+        return bool(self._kind & String._kind_bit)
 
     def is_struct(self) -> bool:
-        return isinstance(self, Struct)
+        return bool(self._kind & Struct._kind_bit)
 
     def is_temporal(self) -> bool:
-        return isinstance(self, Temporal)
+        return bool(self._kind & Temporal._kind_bit)
 
     def is_time(self) -> bool:
-        return isinstance(self, Time)
+        return bool(self._kind & Time._kind_bit)
 
     def is_timestamp(self) -> bool:
-        return isinstance(self, Timestamp)
+        return bool(self._kind & Timestamp._kind_bit)
 
     def is_uint16(self) -> bool:
-        return isinstance(self, UInt16)
+        return bool(self._kind & UInt16._kind_bit)
 
     def is_uint32(self) -> bool:
-        return isinstance(self, UInt32)
+        return bool(self._kind & UInt32._kind_bit)
 
     def is_uint64(self) -> bool:
-        return isinstance(self, UInt64)
+        return bool(self._kind & UInt64._kind_bit)
 
     def is_uint8(self) -> bool:
-        return isinstance(self, UInt8)
+        return bool(self._kind & UInt8._kind_bit)
 
     def is_unknown(self) -> bool:
-        return isinstance(self, Unknown)
+        return bool(self._kind & Unknown._kind_bit)
 
     def is_unsigned_integer(self) -> bool:
-        return isinstance(self, UnsignedInteger)
+        return bool(self._kind & UnsignedInteger._kind_bit)
 
     def is_uuid(self) -> bool:
-        return isinstance(self, UUID)
+        return bool(self._kind & UUID._kind_bit)
 
     def is_variadic(self) -> bool:
-        return isinstance(self, Variadic)
+        return bool(self._kind & Variadic._kind_bit)
 
 
 @dtype.register(DataType)
@@ -404,7 +451,7 @@ class Time(Temporal, Primitive):
 
 
 @public
-class Timestamp(Temporal, Parametric):
+class Timestamp(Temporal, Parametric, Singleton):
     """Timestamp values."""
 
     timezone: Optional[str] = None
@@ -434,11 +481,10 @@ class SignedInteger(Integer):
         """Return the largest type of signed integer."""
         return int64
 
-    @property
-    def bounds(self):
-        exp = self.nbytes * 8 - 1
-        upper = (1 << exp) - 1
-        return Bounds(lower=~upper, upper=upper)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        upper = (1 << (cls.nbytes * 8 - 1)) - 1
+        cls.bounds = Bounds(lower=~upper, upper=upper)
 
 
 @public
@@ -450,11 +496,9 @@ class UnsignedInteger(Integer):
         """Return the largest type of unsigned integer."""
         return uint64
 
-    @property
-    def bounds(self):
-        exp = self.nbytes * 8 - 1
-        upper = 1 << exp
-        return Bounds(lower=0, upper=upper)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.bounds = Bounds(lower=0, upper=1 << (cls.nbytes * 8 - 1))
 
 
 @public
@@ -553,7 +597,7 @@ class Float64(Floating):
 
 
 @public
-class Decimal(Numeric, Parametric):
+class Decimal(Numeric, Parametric, Singleton):
     """Fixed-precision decimal values."""
 
     precision: Optional[int] = None
@@ -617,7 +661,7 @@ class Decimal(Numeric, Parametric):
 
 
 @public
-class Interval(Parametric):
+class Interval(Parametric, Singleton):
     """Interval values."""
 
     unit: IntervalUnit = 's'
@@ -632,8 +676,9 @@ class Interval(Parametric):
     # TODO(kszucs): assert that the nullability if the value_type is equal
     # to the interval's nullability
 
-    @property
-    def bounds(self):
+    @attribute.default
+    def bounds(self) -> Bounds:
+        """Return the bounds of the underlying integer type."""
         return self.value_type.bounds
 
     @property
@@ -681,18 +726,18 @@ class Struct(Parametric, MapSet):
     @attribute.default
     def names(self) -> tuple[str, ...]:
         """Return the names of the struct's fields."""
-        return tuple(self.keys())
+        return tuple(self.fields.keys())
 
     @attribute.default
     def types(self) -> tuple[DataType, ...]:
         """Return the types of the struct's fields."""
-        return tuple(self.values())
+        return tuple(self.fields.values())
 
     def __len__(self) -> int:
-        return len(self.fields)
+        return len(self.names)
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.fields)
+        return iter(self.names)
 
     def __getitem__(self, key: str) -> DataType:
         return self.fields[key]
@@ -707,7 +752,7 @@ class Struct(Parametric, MapSet):
 
 
 @public
-class Array(Variadic, Parametric):
+class Array(Variadic, Parametric, Singleton):
     """Array values."""
 
     value_type: DataType
@@ -721,7 +766,7 @@ class Array(Variadic, Parametric):
 
 
 @public
-class Set(Variadic, Parametric):
+class Set(Variadic, Parametric, Singleton):
     """Set values."""
 
     value_type: DataType
@@ -735,7 +780,7 @@ class Set(Variadic, Parametric):
 
 
 @public
-class Map(Variadic, Parametric):
+class Map(Variadic, Parametric, Singleton):
     """Associative array values."""
 
     key_type: DataType
@@ -858,6 +903,8 @@ class INET(String):
 
 # ---------------------------------------------------------------------
 
+_NESTED_KIND = Array._kind_bit | Map._kind_bit | Struct._kind_bit | Set._kind_bit
+
 null = Null()
 boolean = Boolean()
 int8 = Int8()
@@ -898,59 +945,73 @@ unknown = Unknown()
 Enum = String
 
 
-_python_dtypes = {
-    bool: boolean,
-    int: int64,
-    float: float64,
-    str: string,
-    bytes: binary,
-    pydatetime.date: date,
-    pydatetime.time: time,
-    pydatetime.datetime: timestamp,
-    pydatetime.timedelta: interval,
-    pydecimal.Decimal: decimal,
-    pyuuid.UUID: uuid,
-}
-
-_numpy_dtypes = {
-    np.dtype("bool"): boolean,
-    np.dtype("int8"): int8,
-    np.dtype("int16"): int16,
-    np.dtype("int32"): int32,
-    np.dtype("int64"): int64,
-    np.dtype("uint8"): uint8,
-    np.dtype("uint16"): uint16,
-    np.dtype("uint32"): uint32,
-    np.dtype("uint64"): uint64,
-    np.dtype("float16"): float16,
-    np.dtype("float32"): float32,
-    np.dtype("float64"): float64,
-    np.dtype("double"): float64,
-    np.dtype("unicode"): string,
-    np.dtype("str"): string,
-    np.dtype("datetime64"): timestamp,
-    np.dtype("datetime64[Y]"): timestamp,
-    np.dtype("datetime64[M]"): timestamp,
-    np.dtype("datetime64[W]"): timestamp,
-    np.dtype("datetime64[D]"): timestamp,
-    np.dtype("datetime64[h]"): timestamp,
-    np.dtype("datetime64[m]"): timestamp,
-    np.dtype("datetime64[s]"): timestamp,
-    np.dtype("datetime64[ms]"): timestamp,
-    np.dtype("datetime64[us]"): timestamp,
-    np.dtype("datetime64[ns]"): timestamp,
-    np.dtype("timedelta64"): interval,
-    np.dtype("timedelta64[Y]"): Interval("Y"),
-    np.dtype("timedelta64[M]"): Interval("M"),
-    np.dtype("timedelta64[W]"): Interval("W"),
-    np.dtype("timedelta64[D]"): Interval("D"),
-    np.dtype("timedelta64[h]"): Interval("h"),
-    np.dtype("timedelta64[m]"): Interval("m"),
-    np.dtype("timedelta64[s]"): Interval("s"),
-    np.dtype("timedelta64[ms]"): Interval("ms"),
-    np.dtype("timedelta64[us]"): Interval("us"),
-    np.dtype("timedelta64[ns]"): Interval("ns"),
-}
+_python_dtypes = MappingProxyType(
+    {
+        bool: boolean,
+        int: int64,
+        float: float64,
+        str: string,
+        bytes: binary,
+        pydatetime.date: date,
+        pydatetime.time: time,
+        pydatetime.datetime: timestamp,
+        pydatetime.timedelta: interval,
+        pydecimal.Decimal: decimal,
+        pyuuid.UUID: uuid,
+        type(None): null,
+    }
+)
+
+# fallbacks for subclasses of the python types above, including the types
+# registered with the numbers abstract base classes
+_python_base_dtypes = (
+    (bytes, binary),
+    (str, string),
+    (Integral, int64),
+    (Real, float64),
+)
+
+_numpy_dtypes = MappingProxyType(
+    {
+        np.dtype("bool"): boolean,
+        np.dtype("int8"): int8,
+        np.dtype("int16"): int16,
+        np.dtype("int32"): int32,
+        np.dtype("int64"): int64,
+        np.dtype("uint8"): uint8,
+        np.dtype("uint16"): uint16,
+        np.dtype("uint32"): uint32,
+        np.dtype("uint64"): uint64,
+        np.dtype("float16"): float16,
+        np.dtype("float32"): float32,
+        np.dtype("float64"): float64,
+        np.dtype("double"): float64,
+        np.dtype("unicode"): string,
+        np.dtype("str"): string,
+        np.dtype("datetime64"): timestamp,
+        np.dtype("datetime64[Y]"): timestamp,
+        np.dtype("datetime64[M]"): timestamp,
+        np.dtype("datetime64[W]"): timestamp,
+        np.dtype("datetime64[D]"): timestamp,
+        np.dtype("datetime64[h]"): timestamp,
+        np.dtype("datetime64[m]"): timestamp,
+        np.dtype("datetime64[s]"): timestamp,
+        np.dtype("datetime64[ms]"): timestamp,
+        np.dtype("datetime64[us]"): timestamp,
+        np.dtype("datetime64[ns]"): timestamp,
+        np.dtype("timedelta64"): interval,
+        np.dtype("timedelta64[Y]"): Interval("Y"),
+        np.dtype("timedelta64[M]"): Interval("M"),
+        np.dtype("timedelta64[W]"): Interval("W"),
+        np.dtype("timedelta64[D]"): Interval("D"),
+        np.dtype("timedelta64[h]"): Interval("h"),
+        np.dtype("timedelta64[m]"): Interval("m"),
+        np.dtype("timedelta64[s]"): Interval("s"),
+        np.dtype("timedelta64[ms]"): Interval("ms"),
+        np.dtype("timedelta64[us]"): Interval("us"),
+        np.dtype("timedelta64[ns]"): Interval("ns"),
+    }
+)
 
 
 @dtype.register(np.dtype)
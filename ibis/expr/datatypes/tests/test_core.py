@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import gc
 import sys
 import uuid
+import weakref
 from dataclasses import dataclass
 from typing import Dict, List, NamedTuple, Set, Tuple
 
 import pytest
 
 import ibis.expr.datatypes as dt
+from ibis.common.exceptions import IbisTypeError
 
 
 def test_validate_type():
@@ -79,6 +82,36 @@ def test_dtype_from_classes(klass, expected):
     assert dt.dtype(klass) == expected
 
 
+class BytesSubclass(bytes):
+    pass
+
+
+class StrSubclass(str):
+    pass
+
+
+@pytest.mark.parametrize(
+    ('klass', 'expected'),
+    [
+        (BytesSubclass, dt.binary),
+        (StrSubclass, dt.string),
+        (type(None), dt.null),
+    ],
+)
+def test_dtype_from_python_subclasses(klass, expected):
+    assert dt.dtype(klass) == expected
+
+
+def test_dtype_from_python_class_is_not_kept_alive():
+    klass = type("Dynamic", (StrSubclass,), {})
+    ref = weakref.ref(klass)
+    assert dt.dtype(klass) == dt.string
+
+    del klass
+    gc.collect()
+    assert ref() is None
+
+
 class FooStruct:
     a: dt.int16
     b: dt.int32
@@ -452,6 +485,26 @@ def test_singleton_primitive():
     assert dt.Int64(nullable=False) is dt.Int64(nullable=False)
 
 
+def test_singleton_parametric():
+    assert dt.Array(dt.int64) is dt.Array(dt.int64)
+    assert dt.Array(dt.int64, nullable=False) is not dt.Array(dt.int64)
+    assert dt.Map(dt.string, dt.int64) is dt.Map(dt.string, dt.int64)
+    assert dt.Decimal(38, 9) is dt.Decimal(38, 9)
+    assert dt.Decimal(38, 9) is not dt.Decimal(38, 10)
+    assert dt.Timestamp("UTC") is dt.Timestamp("UTC")
+    assert dt.Decimal(38, 9) is dt.Decimal(precision=38, scale=9)
+
+
+def test_singleton_parametric_validates_cached():
+    assert dt.Decimal(10, 2) is dt.Decimal(10, 2)
+    with pytest.raises(IbisTypeError):
+        dt.Decimal(10.0, 2)
+
+    assert dt.Array(dt.int64) is dt.Array(dt.int64)
+    with pytest.raises(IbisTypeError):
+        dt.Array(dt.int64, nullable="yes")
+
+
 def test_array_type_not_equals():
     left = dt.Array(dt.string)
     right = dt.Array(dt.int32)
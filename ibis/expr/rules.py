@@ -159,6 +159,9 @@ def sort_key_from(table_ref, key, **kwargs):
 
 @rule
 def datatype(arg, **kwargs):
+    # datatype instances are passed through as is, avoid the dispatcher
+    if isinstance(arg, dt.DataType):
+        return arg
     return dt.dtype(arg)
 
 
@@ -371,6 +371,46 @@ class Expr(Immutable):
             **kwargs,
         )
 
+    @experimental
+    def to_arrow_reader(
+        self,
+        *,
+        limit: int | str | None = None,
+        params: Mapping[ir.Value, Any] | None = None,
+        chunk_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> pa.ipc.RecordBatchReader:
+        """Execute expression and return a RecordBatchReader for streaming.
+
+        The reader can be handed directly to consumers that accept a
+        `pyarrow.RecordBatchReader`, avoiding an intermediate copy of the
+        results. This is an alias of `to_pyarrow_batches`.
+
+        Parameters
+        ----------
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        params
+            Mapping of scalar parameter expressions to value.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        results
+            RecordBatchReader
+        """
+        return self._find_backend(use_default=True).to_arrow_reader(
+            self,
+            params=params,
+            limit=limit,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
     @experimental
     def to_pyarrow(
         self,
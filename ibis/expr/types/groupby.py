@@ -19,8 +19,10 @@ from __future__ import annotations
 import itertools
 import types
 from typing import Iterable, Sequence
+from weakref import WeakValueDictionary
 
 import ibis
+import ibis.common.exceptions as com
 import ibis.expr.analysis as an
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
@@ -43,57 +45,119 @@ _function_types = tuple(
 )
 
 
-def _get_group_by_key(table, value):
+def _key_from_str(table, value):
+    return (table[value],)
+
+
+def _key_from_function(table, value):
+    return (value(table),)
+
+
+def _key_from_deferred(table, value):
+    return (value.resolve(table),)
+
+
+def _key_from_selector(table, value):
+    return value.expand(table)
+
+
+def _key_from_expr(table, value):
+    return (an.sub_immediate_parents(value.op(), table.op()).to_expr(),)
+
+
+def _key_from_value(table, value):
+    return (value,)
+
+
+def _group_by_key_handler(value):
     if isinstance(value, str):
-        yield table[value]
+        return _key_from_str
     elif isinstance(value, _function_types):
-        yield value(table)
+        return _key_from_function
     elif isinstance(value, Deferred):
-        yield value.resolve(table)
+        return _key_from_deferred
     elif isinstance(value, Selector):
-        yield from value.expand(table)
+        return _key_from_selector
     elif isinstance(value, ir.Expr):
-        yield an.sub_immediate_parents(value.op(), table.op()).to_expr()
+        return _key_from_expr
     else:
-        yield value
+        return _key_from_value
+
+
+# default window frames of the grouped tables, keyed by the operations of the
+# table, the grouping keys and the ordering keys so that grouped tables built
+# from the same keys share a single frame operation
+_window_frames = WeakValueDictionary()
+
+
+def _window_frame_key(table, by, order_by):
+    if not all(isinstance(expr, ir.Expr) for expr in itertools.chain(by, order_by)):
+        # deferreds, callables and other unresolved keys can't be compared
+        return None
+    return (
+        table.op(),
+        tuple(expr.op() for expr in by),
+        tuple(expr.op() for expr in order_by),
+    )
+
+
+# the handler only depends on the type of the key, so it is looked up once
+# per type instead of running the isinstance checks for every key
+_group_by_key_handlers = {str: _key_from_str}
+
+
+def _get_group_by_key(table, value):
+    typ = type(value)
+    try:
+        handler = _group_by_key_handlers[typ]
+    except KeyError:
+        handler = _group_by_key_handlers[typ] = _group_by_key_handler(value)
+    return handler(table, value)
 
 
 # TODO(kszucs): make a builder class for this
 class GroupedTable:
     """An intermediate table expression to hold grouping information."""
 
+    __slots__ = ('table', 'by', '_order_by', '_having', '_window', '_window_frame')
+
     def __init__(
         self, table, by, having=None, order_by=None, window=None, **expressions
     ):
         self.table = table
-        self.by = list(
-            itertools.chain(
-                itertools.chain.from_iterable(
-                    _get_group_by_key(table, v) for v in util.promote_list(by)
-                ),
-                (
-                    expr.name(k)
-                    for k, v in expressions.items()
-                    for expr in _get_group_by_key(table, v)
-                ),
-            )
-        )
+        keys = []
+        for value in util.promote_list(by):
+            keys.extend(_get_group_by_key(table, value))
+        for name, value in expressions.items():
+            for expr in _get_group_by_key(table, value):
+                keys.append(expr.name(name))
+        self.by = tuple(keys)
         self._order_by = order_by or []
         self._having = having or []
         self._window = window
+        self._window_frame = None
+
+    def _derive(self, *, having, order_by, window):
+        """Return a new grouped table reusing the already resolved keys."""
+        new = object.__new__(self.__class__)
+        new.table = self.table
+        new.by = self.by
+        new._order_by = order_by
+        new._having = having
+        new._window = window
+        new._window_frame = None
+        return new
 
     def __getitem__(self, args):
         # Shortcut for projection with window functions
         return self.select(*args)
 
     def __getattr__(self, attr):
-        if hasattr(self.table, attr):
-            return self._column_wrapper(attr)
+        try:
+            col = self.table[attr]
+        except com.IbisTypeError:
+            raise AttributeError("GroupBy has no attribute %r" % attr) from None
 
-        raise AttributeError("GroupBy has no attribute %r" % attr)
-
-    def _column_wrapper(self, attr):
-        col = self.table[attr]
         if isinstance(col, ir.NumericValue):
             return GroupedNumbers(col, self)
         else:
@@ -120,10 +184,8 @@ class GroupedTable:
         GroupedTable
             A grouped table expression
         """
-        return self.__class__(
-            self.table,
-            self.by,
-            having=self._having + util.promote_list(expr),
+        return self._derive(
+            having=[*self._having, *util.promote_list(expr)],
             order_by=self._order_by,
             window=self._window,
         )
@@ -145,11 +207,9 @@ class GroupedTable:
         GroupedTable
             A sorted grouped GroupedTable
         """
-        return self.__class__(
-            self.table,
-            self.by,
+        return self._derive(
             having=self._having,
-            order_by=self._order_by + util.promote_list(expr),
+            order_by=[*self._order_by, *util.promote_list(expr)],
             window=self._window,
         )
 
@@ -218,33 +278,45 @@ class GroupedTable:
         --------
         [`GroupedTable.mutate`][ibis.expr.types.groupby.GroupedTable.mutate]
         """
-        table = self.table
         default_frame = self._get_window()
-        return [
-            an.windowize_function(e2, frame=default_frame)
-            for expr in exprs
-            for e1 in util.promote_list(expr)
-            for e2 in util.promote_list(table._ensure_expr(e1))
-        ] + [
-            an.windowize_function(e, frame=default_frame).name(k)
-            for k, expr in kwexprs.items()
-            for e in util.promote_list(table._ensure_expr(expr))
-        ]
+        promote_list = util.promote_list
+        ensure_expr = self.table._ensure_expr
+        windowize = an.windowize_function
+
+        selectables = []
+        for expr in exprs:
+            for e1 in promote_list(expr):
+                for e2 in promote_list(ensure_expr(e1)):
+                    selectables.append(windowize(e2, frame=default_frame))
+        for name, expr in kwexprs.items():
+            for e in promote_list(ensure_expr(expr)):
+                selectables.append(windowize(e, frame=default_frame).name(name))
+        return selectables
 
     projection = select
 
     def _get_window(self):
+        # grouped tables are never modified in place, so the frame can be reused
+        if self._window_frame is not None:
+            return self._window_frame
+
         if self._window is None:
-            return ops.RowsWindowFrame(
-                table=self.table,
-                group_by=self.by,
-                order_by=self._order_by,
-            )
+            key = _window_frame_key(self.table, self.by, self._order_by)
+            if key is None or (frame := _window_frames.get(key)) is None:
+                frame = ops.RowsWindowFrame(
+                    table=self.table,
+                    group_by=self.by,
+                    order_by=self._order_by,
+                )
+                if key is not None:
+                    _window_frames[key] = frame
         else:
-            return self._window.copy(
-                groupy_by=self._window.group_by + self.by,
+            frame = self._window.copy(
+                groupy_by=self._window.group_by + list(self.by),
                 order_by=self._window.order_by + self._order_by,
             )
+        self._window_frame = frame
+        return frame
 
     def over(
         self,
@@ -283,9 +355,7 @@ class GroupedTable:
                 order_by=order_by,
             )
 
-        return self.__class__(
-            self.table,
-            self.by,
+        return self._derive(
             having=self._having,
             order_by=self._order_by,
             window=window,
@@ -312,9 +382,8 @@ class GroupedTable:
 
 def _group_agg_dispatch(name):
     def wrapper(self, *args, **kwargs):
-        f = getattr(self.arr, name)
-        metric = f(*args, **kwargs)
-        alias = f'{name}({self.arr.get_name()})'
+        metric = getattr(self.arr, name)(*args, **kwargs)
+        alias = f'{name}({self._arr_name})'
         return self.parent.aggregate(metric.name(alias))
 
     wrapper.__name__ = name
@@ -322,9 +391,12 @@ def _group_agg_dispatch(name):
 
 
 class GroupedArray:
+    __slots__ = ('arr', 'parent', '_arr_name')
+
     def __init__(self, arr, parent):
         self.arr = arr
         self.parent = parent
+        self._arr_name = arr.get_name()
 
     count = _group_agg_dispatch('count')
     size = count
@@ -336,5 +408,7 @@ class GroupedArray:
 
 
 class GroupedNumbers(GroupedArray):
+    __slots__ = ()
+
     mean = _group_agg_dispatch('mean')
     sum = _group_agg_dispatch('sum')
@@ -92,6 +92,9 @@ class BooleanValue(NumericValue):
         │ NULL                                                │
         └─────────────────────────────────────────────────────┘
         """
+        # `True` is the identity of AND, even for NULL operands
+        if other is True:
+            return self
         return _binop(ops.And, self, other)
 
     __rand__ = __and__
@@ -129,6 +132,9 @@ class BooleanValue(NumericValue):
         │ NULL                                 │
         └──────────────────────────────────────┘
         """
+        # `False` is the identity of OR, even for NULL operands
+        if other is False:
+            return self
         return _binop(ops.Or, self, other)
 
     __ror__ = __or__
@@ -190,7 +196,11 @@ class BooleanValue(NumericValue):
         │ NULL                                 │
         └──────────────────────────────────────┘
         """
-
+        # `x ^ False` is `x` and `x ^ True` is `~x`, even for NULL operands
+        if other is False:
+            return self
+        elif other is True:
+            return self.negate()
         return _binop(ops.Xor, self, other)
 
     __rxor__ = __xor__
@@ -226,6 +236,10 @@ class BooleanValue(NumericValue):
         │ NULL     │
         └──────────┘
         """
+        op = self.op()
+        if isinstance(op, ops.Not):
+            # double negation
+            return op.arg.to_expr()
         return self.negate()
 
     @staticmethod
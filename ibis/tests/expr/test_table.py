@@ -677,6 +677,15 @@ def test_group_by_having_api(table):
     assert_equal(expr, expected)
 
 
+def test_group_by_derived_keep_keys(table):
+    grouped = table.group_by('g', z=table.d)
+    postp = table.d.mean() > 1
+
+    for derived in [grouped.having(postp), grouped.order_by('f'), grouped.over()]:
+        assert derived.by == grouped.by
+        assert derived.table is grouped.table
+
+
 def test_group_by_kwargs(table):
     t = table
     expr = t.group_by(['f', t.h], z='g', z2=t.d).aggregate(t.d.mean().name('foo'))
@@ -737,6 +746,17 @@ def test_group_by_column_select_api(table):
         getattr(grouped.f, fn)()
 
 
+def test_group_by_column_select_missing(table):
+    grouped = table.group_by('g')
+
+    with pytest.raises(AttributeError, match="GroupBy has no attribute 'missing'"):
+        grouped.missing  # noqa: B018
+
+    # table methods are not columns of the grouped table
+    with pytest.raises(AttributeError, match="GroupBy has no attribute 'schema'"):
+        grouped.schema  # noqa: B018
+
+
 def test_value_counts_convenience(table):
     # #152
     result = table.g.value_counts()
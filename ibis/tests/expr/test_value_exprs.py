@@ -591,6 +591,35 @@ def test_boolean_logical_ops(table, operation):
     assert isinstance(result, ir.BooleanScalar)
 
 
+@pytest.mark.parametrize(
+    ('operation', 'identity'),
+    [(operator.and_, True), (operator.or_, False)],
+    ids=['and', 'or'],
+)
+def test_boolean_logical_ops_identity(table, operation, identity):
+    expr = table.a > 0
+    assert operation(expr, identity) is expr
+    assert operation(identity, expr) is expr
+
+    result = operation(expr, not identity)
+    assert isinstance(result, ir.BooleanColumn)
+    assert not result.equals(expr)
+
+
+def test_boolean_xor_literal(table):
+    expr = table.a > 0
+    assert (expr ^ False) is expr
+    assert (False ^ expr) is expr
+    assert (expr ^ True).equals(~expr)
+    assert (True ^ expr).equals(~expr)
+
+
+def test_boolean_double_negation(table):
+    expr = table.a > 0
+    assert (~~expr).equals(expr)
+    assert isinstance((~expr).op(), ops.Not)
+
+
 def test_and_(table):
     p1 = table.a > 1
     p2 = table.b > 1
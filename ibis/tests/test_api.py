@@ -71,3 +71,39 @@ import sys
 assert "pandas" not in sys.modules"""
 
     subprocess.check_call([sys.executable], text=script)
+
+
+def test_builtin_backend_names_match_entry_points():
+    from ibis.backends.base import _BUILTIN_BACKENDS
+
+    builtin = {
+        ep.name
+        for ep in ibis.util.backend_entry_points()
+        if ep.value.startswith("ibis.backends.")
+    }
+    assert builtin == _BUILTIN_BACKENDS
+
+
+def test_plugin_backend_names(mocker):
+    from ibis.backends.base import (
+        _get_backend_names,
+        _get_plugin_backend_names,
+        _is_backend_name,
+    )
+
+    entry_point = EntryPoint(
+        name="plugin", value="ibis_plugin:Backend", group="ibis.backends"
+    )
+    mocker.patch("ibis.util.backend_entry_points", return_value=[entry_point])
+    _get_plugin_backend_names.cache_clear()
+    _get_backend_names.cache_clear()
+    try:
+        assert _is_backend_name("duckdb")
+        assert not _get_plugin_backend_names.cache_info().currsize
+
+        assert _is_backend_name("plugin")
+        assert not _is_backend_name("missing")
+        assert "plugin" in _get_backend_names()
+    finally:
+        _get_plugin_backend_names.cache_clear()
+        _get_backend_names.cache_clear()